@@ -1,6 +1,5 @@
 """CLI main application using Typer."""
 
-import asyncio
 import logging
 from pathlib import Path
 from typing import Optional
@@ -20,6 +19,7 @@ from core.infrastructure.repositories.yaml_agent_repository import YamlAgentRepo
 from core.infrastructure.repositories.file_workflow_repository import FileWorkflowRepository
 from core.infrastructure.external_services.openai_adapter import OpenAIAdapter
 from core.infrastructure.config.settings import get_settings
+from core.infrastructure.utils.async_utils import run_with_eager_tasks
 
 # Configure logging
 logging.basicConfig(level=logging.WARNING)  # Reduce noise in CLI
@@ -136,7 +136,7 @@ def generate(
             task = progress.add_task("Generating content...", total=None)
             
             use_case = get_use_case()
-            response = asyncio.run(use_case.execute(request))
+            response = run_with_eager_tasks(use_case.execute(request))
         
         if response.success:
             # Show success message
@@ -7,6 +7,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from core.infrastructure.config.settings import get_settings
+from core.infrastructure.external_services import aclose_shared_http_client
+from core.infrastructure.utils.async_utils import install_eager_task_factory
 from .v1.endpoints import content, workflows, agents, system, knowledge_base
 from .middleware import LoggingMiddleware
 from .exceptions import setup_exception_handlers
@@ -23,6 +25,9 @@ async def lifespan(app: FastAPI):
     logger.info("Starting CGSRef API...")
     settings = get_settings()
     
+    # Let synchronously-completing coroutines skip the event loop round trip
+    install_eager_task_factory()
+    
     # Validate configuration
     if not settings.has_any_provider():
         logger.warning("No AI providers configured. Some features may not work.")
@@ -32,6 +37,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down CGSRef API...")
+    await aclose_shared_http_client()
 
 
 def create_app() -> FastAPI:
@@ -27,6 +27,7 @@ class ContentGenerationRequest:
     generation_params: Optional[GenerationParams] = None
     custom_instructions: str = ""
     context: Dict[str, Any] = None
+    bypass_cache: bool = False
     
     def __post_init__(self) -> None:
         """Initialize default values."""
@@ -55,7 +56,8 @@ class ContentGenerationRequest:
             "provider_config": self.provider_config.to_dict() if self.provider_config else None,
             "generation_params": self.generation_params.to_dict() if self.generation_params else None,
             "custom_instructions": self.custom_instructions,
-            "context": self.context
+            "context": self.context,
+            "bypass_cache": self.bypass_cache
         }
     
     @classmethod
@@ -70,7 +72,8 @@ class ContentGenerationRequest:
             provider_config=ProviderConfig.from_dict(data["provider_config"]) if data.get("provider_config") else None,
             generation_params=GenerationParams.from_dict(data["generation_params"]) if data.get("generation_params") else None,
             custom_instructions=data.get("custom_instructions", ""),
-            context=data.get("context", {})
+            context=data.get("context", {}),
+            bypass_cache=data.get("bypass_cache", False)
         )
 
 
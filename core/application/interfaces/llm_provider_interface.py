@@ -43,6 +43,9 @@ class LLMProviderInterface(ABC):
     LLM providers (OpenAI, Anthropic, DeepSeek, etc.)
     """
     
+    # Stateless, so adapters can declare their own slots
+    __slots__ = ()
+    
     @abstractmethod
     async def generate_content(
         self, 
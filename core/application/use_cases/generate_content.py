@@ -1,9 +1,15 @@
 """Generate content use case."""
 
+import dataclasses
+import hashlib
+import json
 import logging
-from typing import Optional, Dict, Any
-from uuid import uuid4
-from datetime import datetime
+import string
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Tuple
+from uuid import UUID, uuid4
 
 from ...domain.entities.content import Content
 from ...domain.entities.workflow import Workflow, WorkflowType
@@ -23,6 +29,188 @@ from ...infrastructure.workflows.registry import execute_dynamic_workflow, list_
 
 logger = logging.getLogger(__name__)
 
+# Shared content_id for failed generations (nothing is persisted on failure)
+_FAILED_CONTENT_ID = UUID(int=0)
+
+# Bounds for the per-process generation result cache
+_RESULT_CACHE_MAXSIZE = 512
+_RESULT_CACHE_TTL_SECONDS = 3600.0
+
+# LRU cache of successful responses: key -> (stored_at, response). Module level
+# because the API and CLI build a fresh use case for every request.
+_result_cache: "OrderedDict[bytes, Tuple[float, ContentGenerationResponse]]" = OrderedDict()
+
+
+def clear_result_cache() -> None:
+    """Drop all cached generation results."""
+    _result_cache.clear()
+
+# Task description templates for the legacy enhanced article workflow
+_RESEARCH_TASK_TEMPLATE = string.Template("""
+Research comprehensive information about: $topic
+
+RESEARCH REQUIREMENTS:
+- Find current trends and developments
+- Identify key statistics and data points
+- Gather expert opinions and quotes
+- Look for real-world examples and case studies
+- Verify information accuracy and credibility
+
+TARGET AUDIENCE: $target_audience
+TONE: $tone
+            """)
+
+_ARTICLE_TASK_TEMPLATE = string.Template("""
+Create a high-quality article about: $topic
+
+CONTENT REQUIREMENTS:
+- Use research findings from previous task
+- Structure with clear headings and subheadings
+- Include relevant examples and case studies
+- Add statistics and data points where appropriate
+- Maintain consistent tone throughout
+- Ensure content is engaging and informative
+
+TARGET AUDIENCE: $target_audience
+TONE: $tone
+LENGTH: $length length article
+            """)
+
+
+# Task descriptions for the enhanced article workflow. Placeholders such as
+# {topic} and {{task1_brief}} are resolved by the orchestrator at run time.
+_BRIEF_TASK_DESCRIPTION = """
+TASK 1 - SETTING & BRIEF CREATION:
+Recupera tutto il contenuto del cliente selezionato e crea un brief di lavoro completo che integri:
+
+INPUT SOURCES:
+- Topic richiesto: {topic}
+- Contesto aggiuntivo: {context}
+- Target audience: {target_audience}
+- Cliente selezionato: {client_name}
+- Knowledge base del cliente (utilizzando RAG Content Retriever)
+
+STEP 1: RETRIEVE CLIENT CONTENT
+Prima di tutto, usa il tool RAG per recuperare il contenuto del cliente:
+[rag_get_client_content] {client_name} [/rag_get_client_content]
+
+STEP 2: ANALYZE AND CREATE BRIEF
+Analizza il contenuto recuperato e crea un brief strutturato che includa:
+
+OBIETTIVI:
+1. Analizza la knowledge base del cliente per comprendere brand voice, style guidelines, e contenuti esistenti
+2. Integra le informazioni dall'interfaccia (topic, contesto, target)
+3. Crea un brief strutturato che serva da riferimento per gli altri agent
+4. Definisci chiaramente ruoli, obiettivi e output richiesto
+
+STRUTTURA DEL BRIEF:
+- Executive Summary del progetto
+- Brand Context & Guidelines (dal RAG)
+- Topic Analysis & Objectives
+- Target Audience Profile
+- Content Requirements & Specifications
+- Agent Roles & Responsibilities
+- Success Criteria & Expected Output
+            """
+
+_RESEARCH_ENHANCEMENT_TASK_DESCRIPTION = """
+TASK 2 - WEB RESEARCH & BRIEF ENHANCEMENT:
+Ricevi il brief creato nel Task precedente e arricchiscilo con ricerche web aggiornate e pertinenti.
+
+CONTEXT FROM PREVIOUS TASK:
+Il task precedente ha creato un brief completo. Utilizza questo brief come base e arricchiscilo.
+
+INPUT:
+{{task1_brief}}
+
+STEP 1: ANALYZE BRIEF
+Analizza il brief ricevuto per identificare gap informativi e aree che necessitano di ricerca web.
+
+STEP 2: CONDUCT WEB RESEARCH
+Conduci ricerche web mirate utilizzando questi tool calls:
+
+Per informazioni generali:
+[web_search] {topic} trends 2025 latest developments [/web_search]
+
+Per contenuti finanziari (se applicabile):
+[web_search_financial] {topic}, crypto,day_trading [/web_search_financial]
+
+Per statistiche e dati:
+[web_search] {topic} statistics data recent studies [/web_search]
+
+STEP 3: INTEGRATE FINDINGS
+Integra le informazioni trovate nel brief esistente e crea un brief arricchito.
+
+OBIETTIVI:
+1. Analizza il brief ricevuto per identificare gap informativi
+2. Conduci ricerche web mirate su:
+   - Trend attuali relativi a {topic}
+   - Statistiche e dati recenti
+   - Best practices del settore
+   - Casi studio rilevanti
+3. Integra le informazioni trovate nel brief esistente
+4. Affina e migliora le sezioni del brief con dati aggiornati
+
+FOCUS AREAS:
+- Cerca informazioni che supportino gli obiettivi definiti nel brief
+- Identifica opportunità per differenziare il contenuto
+- Trova dati e statistiche che rafforzino i messaggi chiave
+            """
+
+_CONTENT_TASK_DESCRIPTION = """
+TASK 3 - FINAL CONTENT CREATION:
+Utilizzando il brief arricchito del task precedente, crea l'articolo finale che rispetti tutti i requisiti definiti.
+
+CONTEXT FROM PREVIOUS TASKS:
+Hai accesso al brief originale e alla ricerca web integrata. Utilizza entrambi per creare contenuto eccellente.
+
+INPUT:
+{{task2_research}}
+
+OBIETTIVI:
+1. Analizza il brief arricchito per comprendere tutti i requirements
+2. Struttura l'articolo seguendo le guidelines del brand
+3. Integra seamlessly le informazioni di ricerca con il brand voice
+4. Crea contenuto engaging che parli direttamente al target audience: {target_audience}
+5. Assicura coerenza con tutti i criteri di successo definiti nel brief
+
+CONTENT CREATION GUIDELINES:
+- Segui scrupolosamente il brand voice definito nel brief
+- Utilizza la terminologia specifica del cliente {client_name}
+- Integra naturalmente dati e statistiche dalla ricerca
+- Mantieni focus su obiettivi e target audience definiti
+- Crea un flow narrativo coinvolgente e professionale
+- Include call-to-action appropriati
+
+QUALITY ASSURANCE:
+- Verifica allineamento con brand guidelines
+- Controlla coerenza del tone of voice
+- Assicura che tutti i key messages siano inclusi
+- Valida la rilevanza per il target audience
+            """
+
+
+def _build_tool_specs(web_search_tool: WebSearchTool, rag_tool: RAGTool) -> Mapping[str, Dict[str, Any]]:
+    """Build the read-only tool spec mapping registered with the agent executor."""
+    return MappingProxyType({
+        'web_search': {
+            'function': web_search_tool.search,
+            'description': 'Search the web for current information and trends'
+        },
+        'web_search_financial': {
+            'function': web_search_tool.search_financial_content,
+            'description': 'Search for current financial content and market trends'
+        },
+        'rag_get_client_content': {
+            'function': rag_tool.get_client_content,
+            'description': 'Retrieve content from client knowledge base'
+        },
+        'rag_search_content': {
+            'function': rag_tool.search_content,
+            'description': 'Search within client knowledge base'
+        }
+    })
+
 
 class GenerateContentUseCase:
     """
@@ -71,31 +259,43 @@ class GenerateContentUseCase:
             Content generation response
         """
         try:
-            logger.info(f"Starting content generation for topic: {request.topic}")
-            start_time = datetime.utcnow()
+            logger.info("Starting content generation for topic: %s", request.topic)
+            start_time = time.perf_counter()
 
-            # 1. Build dynamic context from request
-            context = await self._build_dynamic_context(request)
+            # Serialize generation params once and reuse for the whole request
+            params_snapshot = request.generation_params.to_dict() if request.generation_params else {}
 
-            # 2. Execute dynamic workflow
             # Default to enhanced_article if workflow_type is None or not specified
             workflow_type = request.workflow_type
             if not workflow_type or workflow_type == 'None':
                 workflow_type = 'enhanced_article'
-                logger.info(f"🔧 No workflow_type specified, defaulting to: {workflow_type}")
+                logger.debug("No workflow_type specified, defaulting to: %s", workflow_type)
 
+            # Return a cached response for an identical request
+            cache_key = None
+            if not request.bypass_cache:
+                cache_key = self._result_cache_key(workflow_type, request, params_snapshot)
+                cached = self._get_cached_result(cache_key)
+                if cached is not None:
+                    logger.info("Returning cached content for topic: %s", request.topic)
+                    return cached
+
+            # 1. Build dynamic context from request
+            context = await self._build_dynamic_context(request)
+
+            # 2. Execute dynamic workflow
             workflow_result = await self._execute_dynamic_workflow(workflow_type, context)
 
             # 3. Create content entity from workflow result
             content = await self._create_content_from_dynamic_result(
-                workflow_result, request
+                workflow_result, request, params_snapshot
             )
 
             # 4. Save content
             saved_content = await self.content_repository.save(content)
 
             # 5. Calculate execution time
-            execution_time = (datetime.utcnow() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
 
             # 6. Create response
             response = ContentGenerationResponse(
@@ -121,13 +321,16 @@ class GenerateContentUseCase:
                 }
             )
 
-            logger.info(f"Content generation completed successfully in {execution_time:.2f}s")
+            if cache_key is not None:
+                self._store_cached_result(cache_key, response)
+
+            logger.info("Content generation completed successfully in %.2fs", execution_time)
             return response
             
         except Exception as e:
-            logger.error(f"Content generation failed: {str(e)}")
+            logger.error("Content generation failed: %s", e)
             return ContentGenerationResponse(
-                content_id=uuid4(),
+                content_id=_FAILED_CONTENT_ID,
                 title="",
                 body="",
                 content_type=request.content_type,
@@ -136,6 +339,62 @@ class GenerateContentUseCase:
                 error_message=str(e)
             )
 
+    def _result_cache_key(
+        self,
+        workflow_type: str,
+        request: ContentGenerationRequest,
+        params_snapshot: Dict[str, Any]
+    ) -> bytes:
+        """Compute a stable cache key for a generation request."""
+        provider_config = request.provider_config or self.provider_config
+        payload = json.dumps(
+            {
+                'workflow_type': workflow_type,
+                'topic': request.topic,
+                'client_profile': request.client_profile,
+                'content_type': request.content_type.value,
+                'content_format': request.content_format.value,
+                'provider_config': provider_config.to_dict() if provider_config else None,
+                'custom_instructions': request.custom_instructions,
+                'context': request.context,
+                'params': params_snapshot
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+
+    def _get_cached_result(self, key: bytes) -> Optional[ContentGenerationResponse]:
+        """Get a copy of a cached response, or None if missing or expired."""
+        entry = _result_cache.get(key)
+        if entry is None:
+            return None
+
+        stored_at, response = entry
+        if time.monotonic() - stored_at > _RESULT_CACHE_TTL_SECONDS:
+            del _result_cache[key]
+            return None
+
+        _result_cache.move_to_end(key)
+        return dataclasses.replace(
+            response,
+            generation_time_seconds=0.0,
+            warnings=list(response.warnings),
+            metadata={**response.metadata, 'cache_hit': True}
+        )
+
+    def _store_cached_result(self, key: bytes, response: ContentGenerationResponse) -> None:
+        """Store a successful response, evicting the least recently used entry."""
+        snapshot = dataclasses.replace(
+            response,
+            warnings=list(response.warnings),
+            metadata=dict(response.metadata)
+        )
+        _result_cache[key] = (time.monotonic(), snapshot)
+        _result_cache.move_to_end(key)
+        if len(_result_cache) > _RESULT_CACHE_MAXSIZE:
+            _result_cache.popitem(last=False)
+
     async def _build_dynamic_context(self, request: ContentGenerationRequest) -> Dict[str, Any]:
         """
         Build dynamic context from request with all variables.
@@ -158,10 +417,11 @@ class GenerateContentUseCase:
 
         # Add ALL generation parameters dynamically
         if request.generation_params:
-            params_dict = request.generation_params.__dict__
-            for key, value in params_dict.items():
-                if value is not None:  # Only add non-None values
-                    context[key] = value
+            params = request.generation_params
+            for param_field in dataclasses.fields(params):
+                value = getattr(params, param_field.name)
+                if param_field.init and value is not None:  # Only add non-None values
+                    context[param_field.name] = value
 
         # Add provider config if available
         if request.provider_config:
@@ -173,8 +433,9 @@ class GenerateContentUseCase:
         context['agent_executor'] = self.agent_executor
         context['agent_repository'] = self.agent_repository
 
-        logger.info(f"🔧 Built dynamic context with {len(context)} variables")
-        logger.debug(f"📊 Context keys: {list(context.keys())}")
+        logger.debug("Built dynamic context with %d variables", len(context))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Context keys: %s", context.keys())
 
         return context
 
@@ -193,22 +454,22 @@ class GenerateContentUseCase:
             # Check if workflow type is available
             available_workflows = list_available_workflows()
             if workflow_type not in available_workflows:
-                logger.warning(f"⚠️ Dynamic workflow not found: {workflow_type}")
-                logger.info(f"📋 Available workflows: {list(available_workflows.keys())}")
+                logger.warning("Dynamic workflow not found: %s", workflow_type)
+                logger.debug("Available workflows: %s", available_workflows.keys())
 
                 # Fallback to legacy workflow execution
                 return await self._execute_legacy_workflow(workflow_type, context)
 
             # Execute dynamic workflow
-            logger.info(f"🚀 Executing dynamic workflow: {workflow_type}")
+            logger.debug("Executing dynamic workflow: %s", workflow_type)
             result = await execute_dynamic_workflow(workflow_type, context)
 
-            logger.info(f"✅ Dynamic workflow completed: {workflow_type}")
+            logger.debug("Dynamic workflow completed: %s", workflow_type)
             return result
 
         except Exception as e:
-            logger.error(f"❌ Dynamic workflow execution failed: {str(e)}")
-            logger.info("🔄 Falling back to legacy workflow execution")
+            logger.error("Dynamic workflow execution failed: %s", e)
+            logger.info("Falling back to legacy workflow execution")
             return await self._execute_legacy_workflow(workflow_type, context)
 
     async def _get_or_create_workflow(self, request: ContentGenerationRequest) -> Workflow:
@@ -237,7 +498,7 @@ class GenerateContentUseCase:
         Returns:
             Legacy workflow results
         """
-        logger.info(f"🔄 Executing legacy workflow: {workflow_type}")
+        logger.debug("Executing legacy workflow: %s", workflow_type)
 
         # Create legacy workflow
         workflow = await self._create_legacy_workflow(workflow_type, context)
@@ -245,9 +506,9 @@ class GenerateContentUseCase:
         # Save workflow to repository so it can be found later
         try:
             saved_workflow = await self.workflow_repository.save(workflow)
-            logger.info(f"✅ Workflow saved to repository: {saved_workflow.id}")
+            logger.debug("Workflow saved to repository: %s", saved_workflow.id)
         except Exception as e:
-            logger.warning(f"⚠️ Failed to save workflow to repository: {e}")
+            logger.warning("Failed to save workflow to repository: %s", e)
             # Continue with execution even if save fails
             saved_workflow = workflow
 
@@ -307,23 +568,17 @@ class GenerateContentUseCase:
             description="Enhanced article generation with research and quality assurance"
         )
 
+        topic = context.get('topic', 'the given topic')
+        target_audience = context.get('target_audience', 'general audience')
+        tone = context.get('tone', 'professional')
+
         # Task 1: Research
         task1 = Task(
             id=uuid4(),
             name="Research Topic",
-            description=f"""
-Research comprehensive information about: {context.get('topic', 'the given topic')}
-
-RESEARCH REQUIREMENTS:
-- Find current trends and developments
-- Identify key statistics and data points
-- Gather expert opinions and quotes
-- Look for real-world examples and case studies
-- Verify information accuracy and credibility
-
-TARGET AUDIENCE: {context.get('target_audience', 'general audience')}
-TONE: {context.get('tone', 'professional')}
-            """,
+            description=_RESEARCH_TASK_TEMPLATE.substitute(
+                topic=topic, target_audience=target_audience, tone=tone
+            ),
             expected_output="Comprehensive research notes with verified facts, statistics, and examples",
             task_type=TaskType.RESEARCH,
             agent_role=AgentRole.RESEARCHER,
@@ -334,21 +589,12 @@ TONE: {context.get('tone', 'professional')}
         task2 = Task(
             id=uuid4(),
             name="Generate Article",
-            description=f"""
-Create a high-quality article about: {context.get('topic', 'the given topic')}
-
-CONTENT REQUIREMENTS:
-- Use research findings from previous task
-- Structure with clear headings and subheadings
-- Include relevant examples and case studies
-- Add statistics and data points where appropriate
-- Maintain consistent tone throughout
-- Ensure content is engaging and informative
-
-TARGET AUDIENCE: {context.get('target_audience', 'general audience')}
-TONE: {context.get('tone', 'professional')}
-LENGTH: {context.get('length', 'medium')} length article
-            """,
+            description=_ARTICLE_TASK_TEMPLATE.substitute(
+                topic=topic,
+                target_audience=target_audience,
+                tone=tone,
+                length=context.get('length', 'medium')
+            ),
             expected_output="Well-structured article in markdown format with proper headings",
             task_type=TaskType.WRITING,
             agent_role=AgentRole.WRITER,
@@ -366,7 +612,8 @@ LENGTH: {context.get('length', 'medium')} length article
     async def _create_content_from_dynamic_result(
         self,
         workflow_result: Dict[str, Any],
-        request: ContentGenerationRequest
+        request: ContentGenerationRequest,
+        params_snapshot: Optional[Dict[str, Any]] = None
     ) -> Content:
         """
         Create content entity from dynamic workflow result.
@@ -374,6 +621,7 @@ LENGTH: {context.get('length', 'medium')} length article
         Args:
             workflow_result: Result from dynamic workflow execution
             request: Original request
+            params_snapshot: Pre-serialized generation params, if already computed
 
         Returns:
             Content entity
@@ -388,6 +636,9 @@ LENGTH: {context.get('length', 'medium')} length article
             if task_outputs:
                 final_output = list(task_outputs.values())[-1]
 
+        if params_snapshot is None:
+            params_snapshot = request.generation_params.to_dict() if request.generation_params else {}
+
         # Create content entity
         content = Content(
             title=self._extract_title_from_content(final_output, request.topic),
@@ -398,7 +649,7 @@ LENGTH: {context.get('length', 'medium')} length article
             workflow_id=workflow_result.get('workflow_id'),
             metadata={
                 'workflow_type': request.workflow_type,
-                'generation_params': request.generation_params.to_dict() if request.generation_params else {},
+                'generation_params': params_snapshot,
                 'workflow_summary': workflow_result.get('workflow_summary', {}),
                 'dynamic_workflow': True
             }
@@ -435,24 +686,9 @@ LENGTH: {context.get('length', 'medium')} length article
 
     def _register_tools(self) -> None:
         """Register tools with the agent executor."""
-        self.agent_executor.register_tools({
-            'web_search': {
-                'function': self.web_search_tool.search,
-                'description': 'Search the web for current information and trends'
-            },
-            'web_search_financial': {
-                'function': self.web_search_tool.search_financial_content,
-                'description': 'Search for current financial content and market trends'
-            },
-            'rag_get_client_content': {
-                'function': self.rag_tool.get_client_content,
-                'description': 'Retrieve content from client knowledge base'
-            },
-            'rag_search_content': {
-                'function': self.rag_tool.search_content,
-                'description': 'Search within client knowledge base'
-            }
-        })
+        self.agent_executor.register_tools(
+            _build_tool_specs(self.web_search_tool, self.rag_tool)
+        )
 
     async def _configure_workflow_agents(self, workflow: Workflow, request: ContentGenerationRequest) -> None:
         """Configure agents for the workflow."""
@@ -464,73 +700,6 @@ LENGTH: {context.get('length', 'medium')} length article
         else:
             await self._setup_default_agents(workflow, request)
     
-    async def _execute_workflow(self, workflow: Workflow, request: ContentGenerationRequest) -> str:
-        """Execute the workflow using the task orchestrator."""
-        try:
-            # Build execution context with comprehensive variable mapping
-            context = {
-                'topic': request.topic,
-                'client_name': request.client_profile or 'default',
-                'context': request.context or '',
-                'workflow_type': request.workflow_type,
-                'generation_params': request.generation_params.__dict__ if request.generation_params else {}
-            }
-
-            # Add generation parameters as direct context variables for template substitution
-            if request.generation_params:
-                params = request.generation_params
-
-                # Map common parameters
-                context.update({
-                    'target_audience': getattr(params, 'target_audience', '') or getattr(params, 'target', ''),
-                    'target': getattr(params, 'target', ''),
-                    'tone': getattr(params, 'tone', ''),
-                    'target_word_count': getattr(params, 'target_word_count', ''),
-                    'include_statistics': getattr(params, 'include_statistics', False),
-                    'include_examples': getattr(params, 'include_examples', False),
-                    'include_sources': getattr(params, 'include_sources', False),
-                    'custom_instructions': getattr(params, 'custom_instructions', ''),
-                })
-
-                # Newsletter specific parameters
-                if hasattr(params, 'newsletter_topic'):
-                    context['newsletter_topic'] = getattr(params, 'newsletter_topic', '')
-                if hasattr(params, 'edition_number'):
-                    context['edition_number'] = getattr(params, 'edition_number', '')
-                if hasattr(params, 'featured_sections'):
-                    context['featured_sections'] = getattr(params, 'featured_sections', [])
-
-            # Ensure target_audience is set (fallback to target if not set)
-            if not context.get('target_audience') and context.get('target'):
-                context['target_audience'] = context['target']
-
-            # Add agent executor and repository to context
-            context['agent_executor'] = self.agent_executor
-            context['agent_repository'] = self.agent_repository
-
-            # Execute workflow through orchestrator
-            result = await self.task_orchestrator.execute_workflow(
-                workflow=workflow,
-                context=context,
-                verbose=True
-            )
-
-            if result['success']:
-                # Get final output from task outputs
-                task_outputs = result.get('task_outputs', {})
-                if task_outputs:
-                    # Return the last task's output as final result
-                    final_output = list(task_outputs.values())[-1]
-                    return final_output
-                else:
-                    return "No content generated from workflow execution"
-            else:
-                raise Exception(result.get('error', 'Workflow execution failed'))
-
-        except Exception as e:
-            logger.error(f"Workflow execution failed: {str(e)}")
-            raise
-    
     def _build_generation_context(self, request: ContentGenerationRequest) -> str:
         """Build context for content generation."""
         context_parts = []
@@ -632,39 +801,7 @@ LENGTH: {context.get('length', 'medium')} length article
         # Task 1: RAG Specialist - Brief Creation
         task1 = Task(
             name="task1_brief",
-            description=f"""
-TASK 1 - SETTING & BRIEF CREATION:
-Recupera tutto il contenuto del cliente selezionato e crea un brief di lavoro completo che integri:
-
-INPUT SOURCES:
-- Topic richiesto: {{topic}}
-- Contesto aggiuntivo: {{context}}
-- Target audience: {{target_audience}}
-- Cliente selezionato: {{client_name}}
-- Knowledge base del cliente (utilizzando RAG Content Retriever)
-
-STEP 1: RETRIEVE CLIENT CONTENT
-Prima di tutto, usa il tool RAG per recuperare il contenuto del cliente:
-[rag_get_client_content] {{client_name}} [/rag_get_client_content]
-
-STEP 2: ANALYZE AND CREATE BRIEF
-Analizza il contenuto recuperato e crea un brief strutturato che includa:
-
-OBIETTIVI:
-1. Analizza la knowledge base del cliente per comprendere brand voice, style guidelines, e contenuti esistenti
-2. Integra le informazioni dall'interfaccia (topic, contesto, target)
-3. Crea un brief strutturato che serva da riferimento per gli altri agent
-4. Definisci chiaramente ruoli, obiettivi e output richiesto
-
-STRUTTURA DEL BRIEF:
-- Executive Summary del progetto
-- Brand Context & Guidelines (dal RAG)
-- Topic Analysis & Objectives
-- Target Audience Profile
-- Content Requirements & Specifications
-- Agent Roles & Responsibilities
-- Success Criteria & Expected Output
-            """,
+            description=_BRIEF_TASK_DESCRIPTION,
             expected_output="A comprehensive project brief in markdown format containing all specified sections",
             task_type=TaskType.RESEARCH,
             agent_role=AgentRole.RESEARCHER,
@@ -674,49 +811,7 @@ STRUTTURA DEL BRIEF:
         # Task 2: Web Searcher - Research Enhancement
         task2 = Task(
             name="task2_research",
-            description=f"""
-TASK 2 - WEB RESEARCH & BRIEF ENHANCEMENT:
-Ricevi il brief creato nel Task precedente e arricchiscilo con ricerche web aggiornate e pertinenti.
-
-CONTEXT FROM PREVIOUS TASK:
-Il task precedente ha creato un brief completo. Utilizza questo brief come base e arricchiscilo.
-
-INPUT:
-{{{{task1_brief}}}}
-
-STEP 1: ANALYZE BRIEF
-Analizza il brief ricevuto per identificare gap informativi e aree che necessitano di ricerca web.
-
-STEP 2: CONDUCT WEB RESEARCH
-Conduci ricerche web mirate utilizzando questi tool calls:
-
-Per informazioni generali:
-[web_search] {{topic}} trends 2025 latest developments [/web_search]
-
-Per contenuti finanziari (se applicabile):
-[web_search_financial] {{topic}}, crypto,day_trading [/web_search_financial]
-
-Per statistiche e dati:
-[web_search] {{topic}} statistics data recent studies [/web_search]
-
-STEP 3: INTEGRATE FINDINGS
-Integra le informazioni trovate nel brief esistente e crea un brief arricchito.
-
-OBIETTIVI:
-1. Analizza il brief ricevuto per identificare gap informativi
-2. Conduci ricerche web mirate su:
-   - Trend attuali relativi a {{topic}}
-   - Statistiche e dati recenti
-   - Best practices del settore
-   - Casi studio rilevanti
-3. Integra le informazioni trovate nel brief esistente
-4. Affina e migliora le sezioni del brief con dati aggiornati
-
-FOCUS AREAS:
-- Cerca informazioni che supportino gli obiettivi definiti nel brief
-- Identifica opportunità per differenziare il contenuto
-- Trova dati e statistiche che rafforzino i messaggi chiave
-            """,
+            description=_RESEARCH_ENHANCEMENT_TASK_DESCRIPTION,
             expected_output="Enhanced brief with web research integration in markdown format",
             task_type=TaskType.RESEARCH,
             agent_role=AgentRole.RESEARCHER,
@@ -727,37 +822,7 @@ FOCUS AREAS:
         # Task 3: Copywriter - Final Content Creation
         task3 = Task(
             name="task3_content",
-            description=f"""
-TASK 3 - FINAL CONTENT CREATION:
-Utilizzando il brief arricchito del task precedente, crea l'articolo finale che rispetti tutti i requisiti definiti.
-
-CONTEXT FROM PREVIOUS TASKS:
-Hai accesso al brief originale e alla ricerca web integrata. Utilizza entrambi per creare contenuto eccellente.
-
-INPUT:
-{{{{task2_research}}}}
-
-OBIETTIVI:
-1. Analizza il brief arricchito per comprendere tutti i requirements
-2. Struttura l'articolo seguendo le guidelines del brand
-3. Integra seamlessly le informazioni di ricerca con il brand voice
-4. Crea contenuto engaging che parli direttamente al target audience: {{target_audience}}
-5. Assicura coerenza con tutti i criteri di successo definiti nel brief
-
-CONTENT CREATION GUIDELINES:
-- Segui scrupolosamente il brand voice definito nel brief
-- Utilizza la terminologia specifica del cliente {{client_name}}
-- Integra naturalmente dati e statistiche dalla ricerca
-- Mantieni focus su obiettivi e target audience definiti
-- Crea un flow narrativo coinvolgente e professionale
-- Include call-to-action appropriati
-
-QUALITY ASSURANCE:
-- Verifica allineamento con brand guidelines
-- Controlla coerenza del tone of voice
-- Assicura che tutti i key messages siano inclusi
-- Valida la rilevanza per il target audience
-            """,
+            description=_CONTENT_TASK_DESCRIPTION,
             expected_output="A polished, publication-ready article in markdown format",
             task_type=TaskType.WRITING,
             agent_role=AgentRole.WRITER,
@@ -65,8 +65,7 @@ class ManageWorkflowsUseCase:
     
     async def list_workflows(self, limit: int = 10, offset: int = 0) -> List[Workflow]:
         """List workflows with pagination."""
-        all_workflows = await self.workflow_repository.get_all()
-        return all_workflows[offset:offset + limit]
+        return await self.workflow_repository.get_paginated(limit, offset)
     
     async def delete_workflow(self, workflow_id: UUID) -> bool:
         """Delete a workflow."""
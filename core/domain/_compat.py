@@ -0,0 +1,8 @@
+"""Python version compatibility helpers for the domain layer."""
+
+import sys
+from typing import Any, Dict
+
+# Keyword arguments enabling __slots__ on dataclasses where supported (Python 3.10+).
+# Usage: @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -1,11 +1,12 @@
 """Agent entity - represents an AI agent in the content generation system."""
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from uuid import UUID, uuid4
 from enum import Enum
 
 from ..value_objects.provider_config import ProviderConfig
+from .._compat import DATACLASS_SLOTS
 
 
 class AgentRole(Enum):
@@ -21,7 +22,22 @@ class AgentRole(Enum):
     PREMIUM_ANALYZER = "premium_analyzer"
 
 
-@dataclass
+# Value -> member lookup for from_dict; unknown values still raise ValueError
+_AGENT_ROLE_BY_VALUE: Dict[str, AgentRole] = {r.value: r for r in AgentRole}
+
+# Default goals per role, used when an agent is created without one
+_DEFAULT_GOALS: Dict[AgentRole, str] = {
+    AgentRole.RESEARCHER: "Gather comprehensive and accurate information on given topics",
+    AgentRole.COPYWRITER: "Create engaging and well-structured content",
+    AgentRole.EDITOR: "Review and improve content for clarity and quality",
+    AgentRole.RAG_SPECIALIST: "Retrieve and analyze relevant information from knowledge bases",
+    AgentRole.WEB_SCRAPER: "Extract and process information from web sources",
+    AgentRole.PREMIUM_ANALYZER: "Analyze premium sources and financial data"
+}
+_FALLBACK_GOAL = "Perform specialized tasks in content generation"
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Agent:
     """
     Agent entity representing an AI agent with specific capabilities.
@@ -37,7 +53,7 @@ class Agent:
     backstory: str = ""
     system_message: str = ""
     provider_config: ProviderConfig = field(default_factory=lambda: ProviderConfig())
-    tools: List[str] = field(default_factory=list)
+    tools: Set[str] = field(default_factory=set)
     examples: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
     is_active: bool = True
@@ -49,18 +65,13 @@ class Agent:
         
         if not self.goal:
             self.goal = self._default_goal_for_role()
+        
+        if not isinstance(self.tools, set):
+            self.tools = set(self.tools)
     
     def _default_goal_for_role(self) -> str:
         """Get default goal based on agent role."""
-        default_goals = {
-            AgentRole.RESEARCHER: "Gather comprehensive and accurate information on given topics",
-            AgentRole.COPYWRITER: "Create engaging and well-structured content",
-            AgentRole.EDITOR: "Review and improve content for clarity and quality",
-            AgentRole.RAG_SPECIALIST: "Retrieve and analyze relevant information from knowledge bases",
-            AgentRole.WEB_SCRAPER: "Extract and process information from web sources",
-            AgentRole.PREMIUM_ANALYZER: "Analyze premium sources and financial data"
-        }
-        return default_goals.get(self.role, "Perform specialized tasks in content generation")
+        return _DEFAULT_GOALS.get(self.role, _FALLBACK_GOAL)
     
     def can_use_tool(self, tool_name: str) -> bool:
         """Check if agent can use a specific tool."""
@@ -68,13 +79,11 @@ class Agent:
     
     def add_tool(self, tool_name: str) -> None:
         """Add a tool to the agent's capabilities."""
-        if tool_name not in self.tools:
-            self.tools.append(tool_name)
+        self.tools.add(tool_name)
     
     def remove_tool(self, tool_name: str) -> None:
         """Remove a tool from the agent's capabilities."""
-        if tool_name in self.tools:
-            self.tools.remove(tool_name)
+        self.tools.discard(tool_name)
     
     def update_provider_config(self, provider_config: ProviderConfig) -> None:
         """Update the agent's provider configuration."""
@@ -90,7 +99,7 @@ class Agent:
             "backstory": self.backstory,
             "system_message": self.system_message,
             "provider_config": self.provider_config.to_dict(),
-            "tools": self.tools,
+            "tools": sorted(self.tools),
             "examples": self.examples,
             "metadata": self.metadata,
             "is_active": self.is_active
@@ -99,10 +108,11 @@ class Agent:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Agent":
         """Create agent from dictionary representation."""
+        role = data.get("role", "researcher")
         return cls(
             id=UUID(data["id"]) if "id" in data else uuid4(),
             name=data.get("name", ""),
-            role=AgentRole(data.get("role", "researcher")),
+            role=_AGENT_ROLE_BY_VALUE.get(role) or AgentRole(role),
             goal=data.get("goal", ""),
             backstory=data.get("backstory", ""),
             system_message=data.get("system_message", ""),
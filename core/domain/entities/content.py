@@ -1,11 +1,20 @@
 """Content entity - represents generated content."""
 
+import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, List, Optional, Any, Set
 from uuid import UUID, uuid4
 from enum import Enum
 from datetime import datetime
 
+import orjson
+
+from .._compat import DATACLASS_SLOTS
+
+# Markdown syntax characters stripped when converting to plain text
+_MARKDOWN_STRIP_TABLE = str.maketrans('', '', '#*`_[]()')
+_MULTI_NEWLINE_RE = re.compile(r'\n+')
+
 
 class ContentType(Enum):
     """Types of generated content."""
@@ -36,7 +45,23 @@ class ContentFormat(Enum):
     JSON = "json"
 
 
-@dataclass
+# Value -> member lookups for from_dict; unknown values fall back to the
+# enum constructor so they still raise ValueError
+_CONTENT_TYPE_BY_VALUE: Dict[str, ContentType] = {t.value: t for t in ContentType}
+_CONTENT_STATUS_BY_VALUE: Dict[str, ContentStatus] = {s.value: s for s in ContentStatus}
+_CONTENT_FORMAT_BY_VALUE: Dict[str, ContentFormat] = {f.value: f for f in ContentFormat}
+
+# Allowed content status transitions
+_VALID_TRANSITIONS: Dict[ContentStatus, FrozenSet[ContentStatus]] = {
+    ContentStatus.DRAFT: frozenset({ContentStatus.REVIEW, ContentStatus.ARCHIVED}),
+    ContentStatus.REVIEW: frozenset({ContentStatus.DRAFT, ContentStatus.APPROVED, ContentStatus.ARCHIVED}),
+    ContentStatus.APPROVED: frozenset({ContentStatus.PUBLISHED, ContentStatus.REVIEW, ContentStatus.ARCHIVED}),
+    ContentStatus.PUBLISHED: frozenset({ContentStatus.ARCHIVED}),
+    ContentStatus.ARCHIVED: frozenset({ContentStatus.DRAFT})
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ContentMetrics:
     """Metrics for content analysis."""
     word_count: int = 0
@@ -51,7 +76,7 @@ class ContentMetrics:
             self.reading_time_minutes = self.word_count / words_per_minute
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Content:
     """
     Content entity representing generated content.
@@ -71,16 +96,37 @@ class Content:
     target_audience: str = ""
     topic: str = ""
     tags: List[str] = field(default_factory=list)
-    metrics: ContentMetrics = field(default_factory=ContentMetrics)
     metadata: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: Optional[datetime] = None  # Defaults to created_at
     published_at: Optional[datetime] = None
     version: int = 1
+    # Metrics are computed on first access and recomputed after content changes
+    _metrics: ContentMetrics = field(default_factory=ContentMetrics, init=False, repr=False, compare=False)
+    _metrics_dirty: bool = field(default=True, init=False, repr=False, compare=False)
+    # Converted bodies keyed by (source, target) format, valid while body is unchanged
+    _format_cache: Dict[Any, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Presence index over tags, kept in step by add_tag/remove_tag
+    _tag_index: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
     
     def __post_init__(self) -> None:
-        """Calculate metrics after initialization."""
-        self.update_metrics()
+        """Default updated_at to the creation timestamp and index tags."""
+        if self.updated_at is None:
+            self.updated_at = self.created_at
+        self._tag_index.update(self.tags)
+    
+    @property
+    def metrics(self) -> ContentMetrics:
+        """Content metrics, calculated lazily from the current body."""
+        if self._metrics_dirty:
+            self.update_metrics()
+        return self._metrics
+    
+    @metrics.setter
+    def metrics(self, metrics: ContentMetrics) -> None:
+        """Set precomputed (e.g. persisted) metrics."""
+        self._metrics = metrics
+        self._metrics_dirty = False
     
     def update_content(self, title: Optional[str] = None, body: Optional[str] = None) -> None:
         """Update content and recalculate metrics."""
@@ -91,61 +137,63 @@ class Content:
         
         self.updated_at = datetime.utcnow()
         self.version += 1
-        self.update_metrics()
+        self._metrics_dirty = True
+        self._format_cache.clear()
     
     def update_metrics(self) -> None:
         """Update content metrics based on current content."""
-        # Calculate word and character counts
-        words = self.body.split() if self.body else []
-        self.metrics.word_count = len(words)
-        self.metrics.character_count = len(self.body)
-        self.metrics.calculate_reading_time()
+        metrics = self._metrics
+        body = self.body
+        
+        # Calculate word and character counts. str.split() stays: a count of
+        # spaces misses newline-separated words, and regex counting is slower.
+        metrics.word_count = len(body.split())
+        metrics.character_count = len(body)
+        metrics.calculate_reading_time()
+        self._metrics_dirty = False
     
     def add_tag(self, tag: str) -> None:
         """Add a tag to the content."""
-        if tag not in self.tags:
+        if tag not in self._tag_index:
+            self._tag_index.add(tag)
             self.tags.append(tag)
             self.updated_at = datetime.utcnow()
     
     def remove_tag(self, tag: str) -> None:
         """Remove a tag from the content."""
-        if tag in self.tags:
+        if tag in self._tag_index:
+            self._tag_index.discard(tag)
             self.tags.remove(tag)
             self.updated_at = datetime.utcnow()
     
     def change_status(self, new_status: ContentStatus) -> None:
         """Change content status with validation."""
-        valid_transitions = {
-            ContentStatus.DRAFT: [ContentStatus.REVIEW, ContentStatus.ARCHIVED],
-            ContentStatus.REVIEW: [ContentStatus.DRAFT, ContentStatus.APPROVED, ContentStatus.ARCHIVED],
-            ContentStatus.APPROVED: [ContentStatus.PUBLISHED, ContentStatus.REVIEW, ContentStatus.ARCHIVED],
-            ContentStatus.PUBLISHED: [ContentStatus.ARCHIVED],
-            ContentStatus.ARCHIVED: [ContentStatus.DRAFT]
-        }
-        
-        if new_status not in valid_transitions.get(self.status, []):
+        if new_status not in _VALID_TRANSITIONS.get(self.status, frozenset()):
             raise ValueError(f"Invalid status transition from {self.status} to {new_status}")
         
+        now = datetime.utcnow()
         self.status = new_status
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
         
         if new_status == ContentStatus.PUBLISHED:
-            self.published_at = datetime.utcnow()
+            self.published_at = now
     
     def get_excerpt(self, max_length: int = 200) -> str:
         """Get a short excerpt of the content."""
         if len(self.body) <= max_length:
             return self.body
         
-        # Try to break at a sentence boundary
+        # Try to break at a sentence boundary, only scanning the tail where
+        # a break point would be good enough (past 70% of max_length)
         excerpt = self.body[:max_length]
+        min_break = int(max_length * 0.7) + 1
         last_sentence_end = max(
-            excerpt.rfind('.'),
-            excerpt.rfind('!'),
-            excerpt.rfind('?')
+            excerpt.rfind('.', min_break),
+            excerpt.rfind('!', min_break),
+            excerpt.rfind('?', min_break)
         )
         
-        if last_sentence_end > max_length * 0.7:  # If we found a good break point
+        if last_sentence_end != -1:  # If we found a good break point
             return excerpt[:last_sentence_end + 1]
         else:
             # Break at word boundary
@@ -157,82 +205,115 @@ class Content:
     
     def convert_format(self, target_format: ContentFormat) -> str:
         """Convert content to different format (basic implementation)."""
-        if self.content_format == target_format:
-            return self.body
+        body = self.body
+        if self.content_format == target_format or not body:
+            return body
+        
+        key = (self.content_format, target_format)
+        cached = self._format_cache.get(key)
+        if cached is not None and cached[0] is body:
+            return cached[1]
         
         # Basic format conversions
+        converted = body  # Fallback to original content
         if self.content_format == ContentFormat.MARKDOWN:
             if target_format == ContentFormat.PLAIN_TEXT:
                 # Simple markdown to text conversion
-                import re
-                text = re.sub(r'[#*`_\[\]()]', '', self.body)
-                text = re.sub(r'\n+', '\n', text)
-                return text.strip()
+                text = body.translate(_MARKDOWN_STRIP_TABLE)
+                text = _MULTI_NEWLINE_RE.sub('\n', text)
+                converted = text.strip()
             elif target_format == ContentFormat.HTML:
                 # Would need a proper markdown parser in real implementation
-                return f"<html><body>{self.body}</body></html>"
+                converted = f"<html><body>{body}</body></html>"
         
-        return self.body  # Fallback to original content
+        self._format_cache[key] = (body, converted)
+        return converted
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert content to dictionary representation."""
+    def _native_dict(self) -> Dict[str, Any]:
+        """Field mapping with UUID, datetime and enum values left unconverted."""
+        metrics = self.metrics
         return {
-            "id": str(self.id),
+            "id": self.id,
             "title": self.title,
             "body": self.body,
-            "content_type": self.content_type.value,
-            "content_format": self.content_format.value,
-            "status": self.status.value,
-            "workflow_id": str(self.workflow_id) if self.workflow_id else None,
+            "content_type": self.content_type,
+            "content_format": self.content_format,
+            "status": self.status,
+            "workflow_id": self.workflow_id,
             "client_profile": self.client_profile,
             "target_audience": self.target_audience,
             "topic": self.topic,
             "tags": self.tags,
             "metrics": {
-                "word_count": self.metrics.word_count,
-                "character_count": self.metrics.character_count,
-                "reading_time_minutes": self.metrics.reading_time_minutes,
-                "readability_score": self.metrics.readability_score,
-                "sentiment_score": self.metrics.sentiment_score
+                "word_count": metrics.word_count,
+                "character_count": metrics.character_count,
+                "reading_time_minutes": metrics.reading_time_minutes,
+                "readability_score": metrics.readability_score,
+                "sentiment_score": metrics.sentiment_score
             },
             "metadata": self.metadata,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "published_at": self.published_at.isoformat() if self.published_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "published_at": self.published_at,
             "version": self.version
         }
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert content to dictionary representation."""
+        data = self._native_dict()
+        data["id"] = str(self.id)
+        data["content_type"] = self.content_type.value
+        data["content_format"] = self.content_format.value
+        data["status"] = self.status.value
+        data["workflow_id"] = str(self.workflow_id) if self.workflow_id else None
+        data["created_at"] = self.created_at.isoformat()
+        data["updated_at"] = self.updated_at.isoformat()
+        data["published_at"] = self.published_at.isoformat() if self.published_at else None
+        return data
+    
+    def to_json_bytes(self, include_body: bool = True, indent: bool = False) -> bytes:
+        """Serialize content to JSON bytes; same document as ``to_dict``."""
+        data = self._native_dict()
+        if not include_body:
+            del data["body"]
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Content":
         """Create content from dictionary representation."""
+        content_type = data.get("content_type", "article")
+        content_format = data.get("content_format", "markdown")
+        status = data.get("status", "draft")
+        now = datetime.utcnow()
         content = cls(
             id=UUID(data["id"]) if "id" in data else uuid4(),
             title=data.get("title", ""),
             body=data.get("body", ""),
-            content_type=ContentType(data.get("content_type", "article")),
-            content_format=ContentFormat(data.get("content_format", "markdown")),
-            status=ContentStatus(data.get("status", "draft")),
+            content_type=_CONTENT_TYPE_BY_VALUE.get(content_type) or ContentType(content_type),
+            content_format=_CONTENT_FORMAT_BY_VALUE.get(content_format) or ContentFormat(content_format),
+            status=_CONTENT_STATUS_BY_VALUE.get(status) or ContentStatus(status),
             workflow_id=UUID(data["workflow_id"]) if data.get("workflow_id") else None,
             client_profile=data.get("client_profile"),
             target_audience=data.get("target_audience", ""),
             topic=data.get("topic", ""),
             tags=data.get("tags", []),
             metadata=data.get("metadata", {}),
-            created_at=datetime.fromisoformat(data["created_at"]) if "created_at" in data else datetime.utcnow(),
-            updated_at=datetime.fromisoformat(data["updated_at"]) if "updated_at" in data else datetime.utcnow(),
+            created_at=datetime.fromisoformat(data["created_at"]) if "created_at" in data else now,
+            updated_at=datetime.fromisoformat(data["updated_at"]) if "updated_at" in data else now,
             published_at=datetime.fromisoformat(data["published_at"]) if data.get("published_at") else None,
             version=data.get("version", 1)
         )
         
-        # Set metrics if present
+        # Use persisted metrics as-is; they are only recalculated after edits
         if "metrics" in data:
             metrics_data = data["metrics"]
-            content.metrics = ContentMetrics(
-                word_count=metrics_data.get("word_count", 0),
-                character_count=metrics_data.get("character_count", 0),
-                reading_time_minutes=metrics_data.get("reading_time_minutes", 0.0),
-                readability_score=metrics_data.get("readability_score"),
-                sentiment_score=metrics_data.get("sentiment_score")
-            )
+            metrics = content._metrics
+            metrics.word_count = metrics_data.get("word_count", 0)
+            metrics.character_count = metrics_data.get("character_count", 0)
+            metrics.reading_time_minutes = metrics_data.get("reading_time_minutes", 0.0)
+            metrics.readability_score = metrics_data.get("readability_score")
+            metrics.sentiment_score = metrics_data.get("sentiment_score")
+            content._metrics_dirty = False
         
         return content
@@ -1,11 +1,16 @@
 """Task entity - represents a task in the content generation workflow."""
 
+import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import AbstractSet, Dict, List, Optional, Any, Set
 from uuid import UUID, uuid4
 from enum import Enum
 from datetime import datetime
 
+import orjson
+
+from .._compat import DATACLASS_SLOTS
+
 
 class TaskStatus(Enum):
     """Task execution status."""
@@ -34,7 +39,13 @@ class TaskType(Enum):
     REVIEW = "review"
 
 
-@dataclass
+# Value -> member lookups for from_dict; unknown values fall back to the
+# enum constructor so they still raise ValueError
+_TASK_STATUS_BY_VALUE: Dict[str, TaskStatus] = {s.value: s for s in TaskStatus}
+_TASK_PRIORITY_BY_VALUE: Dict[str, TaskPriority] = {p.value: p for p in TaskPriority}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TaskResult:
     """Result of a task execution."""
     output: str = ""
@@ -47,7 +58,7 @@ class TaskResult:
         return self.error_message is None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Task:
     """
     Task entity representing a unit of work in the content generation workflow.
@@ -63,7 +74,7 @@ class Task:
     task_type: TaskType = TaskType.RESEARCH
     agent_id: Optional[UUID] = None
     agent_role: Optional[Any] = None  # Will be AgentRole enum
-    dependencies: List[UUID] = field(default_factory=list)
+    dependencies: Set[UUID] = field(default_factory=set)
     tools_required: List[str] = field(default_factory=list)
     context: Dict[str, Any] = field(default_factory=dict)
     priority: TaskPriority = TaskPriority.MEDIUM
@@ -75,23 +86,37 @@ class Task:
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Dependencies not yet completed in the current execution (scheduler state)
+    remaining_deps: int = field(default=0, init=False, repr=False, compare=False)
+    # Bumped on every dependency change so workflows can memoize graph checks
+    dependency_version: int = field(default=0, init=False, repr=False, compare=False)
+    # Monotonic clock readings for start/finish of the current execution
+    _started_perf: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _completed_perf: Optional[float] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self) -> None:
         """Validate task after initialization."""
         if not self.name:
             self.name = f"task_{str(self.id)[:8]}"
+        
+        if not isinstance(self.dependencies, set):
+            self.dependencies = set(self.dependencies)
+        
+        self.remaining_deps = len(self.dependencies)
     
-    def can_start(self, completed_task_ids: List[UUID]) -> bool:
-        """Check if task can start based on dependencies."""
+    def can_start(self, completed_task_ids: AbstractSet[UUID]) -> bool:
+        """Check if task can start based on dependencies (pass completed ids as a set)."""
         if self.status != TaskStatus.PENDING:
             return False
         
         # Check if all dependencies are completed
-        for dep_id in self.dependencies:
-            if dep_id not in completed_task_ids:
-                return False
-        
-        return True
+        return self.dependencies.issubset(completed_task_ids)
+    
+    def on_dependency_completed(self) -> bool:
+        """Record that one dependency completed; return True once none remain."""
+        if self.remaining_deps > 0:
+            self.remaining_deps -= 1
+        return self.remaining_deps == 0
     
     def start(self) -> None:
         """Mark task as started."""
@@ -100,6 +125,8 @@ class Task:
         
         self.status = TaskStatus.RUNNING
         self.started_at = datetime.utcnow()
+        self._started_perf = time.perf_counter()
+        self._completed_perf = None
     
     def complete(self, result: TaskResult) -> None:
         """Mark task as completed with result."""
@@ -108,7 +135,7 @@ class Task:
         
         self.status = TaskStatus.COMPLETED
         self.result = result
-        self.completed_at = datetime.utcnow()
+        self._mark_finished()
     
     def fail(self, error_message: str) -> None:
         """Mark task as failed with error message."""
@@ -117,7 +144,7 @@ class Task:
         
         self.status = TaskStatus.FAILED
         self.result = TaskResult(error_message=error_message)
-        self.completed_at = datetime.utcnow()
+        self._mark_finished()
     
     def cancel(self) -> None:
         """Cancel the task."""
@@ -125,63 +152,100 @@ class Task:
             raise ValueError(f"Cannot cancel task in status: {self.status}")
         
         self.status = TaskStatus.CANCELLED
+        self._mark_finished()
+    
+    def _mark_finished(self) -> None:
+        """Record the completion timestamp and monotonic clock reading."""
         self.completed_at = datetime.utcnow()
+        if self._started_perf is not None:
+            self._completed_perf = time.perf_counter()
     
     def add_dependency(self, task_id: UUID) -> None:
         """Add a dependency to this task."""
         if task_id not in self.dependencies:
-            self.dependencies.append(task_id)
+            self.dependencies.add(task_id)
+            self.remaining_deps += 1
+            self.dependency_version += 1
     
     def remove_dependency(self, task_id: UUID) -> None:
         """Remove a dependency from this task."""
         if task_id in self.dependencies:
-            self.dependencies.remove(task_id)
+            self.dependencies.discard(task_id)
+            if self.remaining_deps > 0:
+                self.remaining_deps -= 1
+            self.dependency_version += 1
     
     def get_execution_time(self) -> Optional[float]:
-        """Get task execution time in seconds."""
+        """Get task execution time in seconds (elapsed so far while running)."""
+        # Prefer the monotonic readings, immune to wall-clock adjustments
+        if self._started_perf is not None:
+            if self._completed_perf is not None:
+                return self._completed_perf - self._started_perf
+            if self.status == TaskStatus.RUNNING:
+                return time.perf_counter() - self._started_perf
         if self.started_at and self.completed_at:
             return (self.completed_at - self.started_at).total_seconds()
         return None
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert task to dictionary representation."""
+    def _native_dict(self) -> Dict[str, Any]:
+        """Field mapping with UUID, datetime and enum values left unconverted."""
         return {
-            "id": str(self.id),
+            "id": self.id,
             "name": self.name,
             "description": self.description,
             "expected_output": self.expected_output,
-            "agent_id": str(self.agent_id) if self.agent_id else None,
-            "dependencies": [str(dep) for dep in self.dependencies],
+            "agent_id": self.agent_id,
+            "dependencies": sorted(self.dependencies, key=str),
             "tools_required": self.tools_required,
             "context": self.context,
-            "priority": self.priority.value,
-            "status": self.status.value,
+            "priority": self.priority,
+            "status": self.status,
             "result": {
                 "output": self.result.output,
                 "metadata": self.result.metadata,
                 "execution_time": self.result.execution_time,
                 "error_message": self.result.error_message
             } if self.result else None,
-            "created_at": self.created_at.isoformat(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
             "metadata": self.metadata
         }
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert task to dictionary representation."""
+        data = self._native_dict()
+        data["id"] = str(self.id)
+        data["agent_id"] = str(self.agent_id) if self.agent_id else None
+        data["dependencies"] = [str(dep) for dep in data["dependencies"]]
+        data["priority"] = self.priority.value
+        data["status"] = self.status.value
+        data["created_at"] = self.created_at.isoformat()
+        data["started_at"] = self.started_at.isoformat() if self.started_at else None
+        data["completed_at"] = self.completed_at.isoformat() if self.completed_at else None
+        return data
+    
+    def to_json_bytes(self, indent: bool = False) -> bytes:
+        """Serialize task to JSON bytes; same document as ``to_dict``."""
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(self._native_dict(), option=option)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Task":
         """Create task from dictionary representation."""
+        priority = data.get("priority", "medium")
+        status = data.get("status", "pending")
         task = cls(
             id=UUID(data["id"]) if "id" in data else uuid4(),
             name=data.get("name", ""),
             description=data.get("description", ""),
             expected_output=data.get("expected_output", ""),
             agent_id=UUID(data["agent_id"]) if data.get("agent_id") else None,
-            dependencies=[UUID(dep) for dep in data.get("dependencies", [])],
+            dependencies={UUID(dep) for dep in data.get("dependencies", [])},
             tools_required=data.get("tools_required", []),
             context=data.get("context", {}),
-            priority=TaskPriority(data.get("priority", "medium")),
-            status=TaskStatus(data.get("status", "pending")),
+            priority=_TASK_PRIORITY_BY_VALUE.get(priority) or TaskPriority(priority),
+            status=_TASK_STATUS_BY_VALUE.get(status) or TaskStatus(status),
             created_at=datetime.fromisoformat(data["created_at"]) if "created_at" in data else datetime.utcnow(),
             started_at=datetime.fromisoformat(data["started_at"]) if data.get("started_at") else None,
             completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
@@ -1,11 +1,16 @@
 """Workflow entity - represents a content generation workflow."""
 
+import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple
 from uuid import UUID, uuid4
 from enum import Enum
 from datetime import datetime
 
+import orjson
+
+from .._compat import DATACLASS_SLOTS
 from .task import Task, TaskStatus
 
 
@@ -29,11 +34,17 @@ class WorkflowType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+# Value -> member lookups for from_dict; unknown values fall back to the
+# enum constructor so they still raise ValueError
+_WORKFLOW_STATUS_BY_VALUE: Dict[str, WorkflowStatus] = {s.value: s for s in WorkflowStatus}
+_WORKFLOW_TYPE_BY_VALUE: Dict[str, WorkflowType] = {t.value: t for t in WorkflowType}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class WorkflowResult:
     """Result of a workflow execution."""
     final_output: str = ""
-    task_outputs: Dict[UUID, str] = field(default_factory=dict)
+    task_outputs: Dict[str, str] = field(default_factory=dict)  # Keyed by str(task.id)
     metadata: Dict[str, Any] = field(default_factory=dict)
     execution_time: Optional[float] = None
     error_message: Optional[str] = None
@@ -43,7 +54,7 @@ class WorkflowResult:
         return self.error_message is None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Workflow:
     """
     Workflow entity representing a content generation workflow.
@@ -67,24 +78,43 @@ class Workflow:
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Reverse dependency index (task id -> dependent tasks), built by index_dependencies
+    _dependents: Dict[Any, List[Task]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Task lookup by id, kept in step with tasks by add_task/remove_task
+    _tasks_by_id: Dict[UUID, Task] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Presence index over agent_ids, kept in step by add_task
+    _agent_id_index: Set[UUID] = field(default_factory=set, init=False, repr=False, compare=False)
+    # Task-set version and memoized cycle check as ((task-set, dependency) versions, result)
+    _graph_version: int = field(default=0, init=False, repr=False, compare=False)
+    _cycle_check: Optional[Tuple[Tuple[int, int], bool]] = field(default=None, init=False, repr=False, compare=False)
+    # Monotonic clock readings for execution timing (not persisted)
+    _started_perf: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _completed_perf: Optional[float] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self) -> None:
         """Validate workflow after initialization."""
         if not self.name:
             self.name = f"{self.workflow_type.value}_workflow"
+        self._tasks_by_id = {task.id: task for task in self.tasks}
+        self._agent_id_index = set(self.agent_ids)
     
     def add_task(self, task: Task) -> None:
         """Add a task to the workflow."""
-        if task.id not in [t.id for t in self.tasks]:
+        if task.id not in self._tasks_by_id:
+            self._tasks_by_id[task.id] = task
             self.tasks.append(task)
+            self._graph_version += 1
             
             # Add agent to workflow if not already present
-            if task.agent_id and task.agent_id not in self.agent_ids:
+            if task.agent_id and task.agent_id not in self._agent_id_index:
+                self._agent_id_index.add(task.agent_id)
                 self.agent_ids.append(task.agent_id)
     
     def remove_task(self, task_id: UUID) -> None:
         """Remove a task from the workflow."""
-        self.tasks = [t for t in self.tasks if t.id != task_id]
+        if self._tasks_by_id.pop(task_id, None) is not None:
+            self.tasks = [t for t in self.tasks if t.id != task_id]
+            self._graph_version += 1
         
         # Remove dependencies on this task
         for task in self.tasks:
@@ -92,21 +122,54 @@ class Workflow:
     
     def get_task_by_id(self, task_id: UUID) -> Optional[Task]:
         """Get a task by its ID."""
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._tasks_by_id.get(task_id)
+    
+    def _iter_ready_tasks(self) -> Iterator[Task]:
+        """Lazily yield tasks that are ready to be executed."""
+        completed_task_ids = {
+            t.id for t in self.tasks
+            if t.status == TaskStatus.COMPLETED
+        }
+        
+        return (task for task in self.tasks if task.can_start(completed_task_ids))
     
     def get_ready_tasks(self) -> List[Task]:
         """Get tasks that are ready to be executed."""
-        completed_task_ids = [
-            t.id for t in self.tasks 
-            if t.status == TaskStatus.COMPLETED
-        ]
+        return list(self._iter_ready_tasks())
+    
+    def index_dependencies(self) -> None:
+        """
+        Build the reverse dependency index and reset task dependency counters.
+        
+        Only dependencies on tasks that belong to this workflow are counted,
+        so a task whose counter reaches zero can be scheduled immediately.
+        """
+        task_ids = {t.id for t in self.tasks}
+        dependents: Dict[Any, List[Task]] = {}
+        
+        for task in self.tasks:
+            known_deps = [dep_id for dep_id in task.dependencies if dep_id in task_ids]
+            task.remaining_deps = len(known_deps)
+            for dep_id in known_deps:
+                dependents.setdefault(dep_id, []).append(task)
         
+        self._dependents = dependents
+    
+    def get_dependents(self, task_id: Any) -> List[Task]:
+        """Get tasks that depend on the given task (see index_dependencies)."""
+        return self._dependents.get(task_id, [])
+    
+    def notify_task_completed(self, task_id: Any) -> List[Task]:
+        """
+        Record that a task finished and return the dependents it unblocked.
+        
+        Each call only touches the finished task's dependents, so discovering
+        ready tasks costs O(out-degree) instead of a full get_ready_tasks scan.
+        Requires index_dependencies (called by mark_ready).
+        """
         return [
-            task for task in self.tasks
-            if task.can_start(completed_task_ids)
+            dependent for dependent in self._dependents.get(task_id, ())
+            if dependent.on_dependency_completed()
         ]
     
     def get_tasks_by_status(self, status: TaskStatus) -> List[Task]:
@@ -122,7 +185,7 @@ class Workflow:
             return False
         
         # Check if there's at least one task that can start
-        return len(self.get_ready_tasks()) > 0
+        return any(True for _ in self._iter_ready_tasks())
     
     def start(self) -> None:
         """Start workflow execution."""
@@ -131,6 +194,8 @@ class Workflow:
         
         self.status = WorkflowStatus.RUNNING
         self.started_at = datetime.utcnow()
+        self._started_perf = time.perf_counter()
+        self._completed_perf = None
     
     def complete(self, result: WorkflowResult) -> None:
         """Complete workflow execution."""
@@ -139,7 +204,7 @@ class Workflow:
         
         self.status = WorkflowStatus.COMPLETED
         self.result = result
-        self.completed_at = datetime.utcnow()
+        self._mark_finished()
     
     def fail(self, error_message: str) -> None:
         """Mark workflow as failed."""
@@ -148,7 +213,7 @@ class Workflow:
         
         self.status = WorkflowStatus.FAILED
         self.result = WorkflowResult(error_message=error_message)
-        self.completed_at = datetime.utcnow()
+        self._mark_finished()
     
     def cancel(self) -> None:
         """Cancel workflow execution."""
@@ -156,13 +221,19 @@ class Workflow:
             raise ValueError(f"Cannot cancel workflow in status: {self.status}")
         
         self.status = WorkflowStatus.CANCELLED
-        self.completed_at = datetime.utcnow()
+        self._mark_finished()
         
         # Cancel all pending and running tasks
         for task in self.tasks:
             if task.status in [TaskStatus.PENDING, TaskStatus.RUNNING]:
                 task.cancel()
     
+    def _mark_finished(self) -> None:
+        """Record the completion timestamp and monotonic clock reading."""
+        self.completed_at = datetime.utcnow()
+        if self._started_perf is not None:
+            self._completed_perf = time.perf_counter()
+    
     def is_completed(self) -> bool:
         """Check if all tasks in workflow are completed."""
         if not self.tasks:
@@ -178,11 +249,17 @@ class Workflow:
         if not self.tasks:
             return 0.0
         
-        completed_tasks = len(self.get_tasks_by_status(TaskStatus.COMPLETED))
+        completed_tasks = sum(1 for task in self.tasks if task.status == TaskStatus.COMPLETED)
         return completed_tasks / len(self.tasks)
     
     def get_execution_time(self) -> Optional[float]:
-        """Get workflow execution time in seconds."""
+        """Get workflow execution time in seconds (elapsed so far while running)."""
+        # Prefer the monotonic readings, immune to wall-clock adjustments
+        if self._started_perf is not None:
+            if self._completed_perf is not None:
+                return self._completed_perf - self._started_perf
+            if self.status == WorkflowStatus.RUNNING:
+                return time.perf_counter() - self._started_perf
         if self.started_at and self.completed_at:
             return (self.completed_at - self.started_at).total_seconds()
         return None
@@ -194,46 +271,49 @@ class Workflow:
         if not self.tasks:
             errors.append("Workflow must have at least one task")
         
-        # Check for circular dependencies
-        if self._has_circular_dependencies():
+        # Check for circular dependencies, reusing the last result while the
+        # task set and every task's dependencies are unchanged
+        versions = (self._graph_version, sum(t.dependency_version for t in self.tasks))
+        if self._cycle_check is None or self._cycle_check[0] != versions:
+            self._cycle_check = (versions, self._has_circular_dependencies())
+        if self._cycle_check[1]:
             errors.append("Workflow has circular task dependencies")
         
         # Check if all agent IDs are valid
         task_agent_ids = {t.agent_id for t in self.tasks if t.agent_id}
-        missing_agents = task_agent_ids - set(self.agent_ids)
+        missing_agents = task_agent_ids.difference(self.agent_ids)
         if missing_agents:
             errors.append(f"Missing agents: {missing_agents}")
         
         return errors
     
     def _has_circular_dependencies(self) -> bool:
-        """Check for circular dependencies in tasks."""
-        # Simple cycle detection using DFS
-        visited = set()
-        rec_stack = set()
-        
-        def has_cycle(task_id: UUID) -> bool:
-            visited.add(task_id)
-            rec_stack.add(task_id)
-            
-            task = self.get_task_by_id(task_id)
-            if task:
-                for dep_id in task.dependencies:
-                    if dep_id not in visited:
-                        if has_cycle(dep_id):
-                            return True
-                    elif dep_id in rec_stack:
-                        return True
-            
-            rec_stack.remove(task_id)
-            return False
+        """Check for circular dependencies in tasks (Kahn's algorithm)."""
+        tasks_by_id = self._tasks_by_id
+        remaining: Dict[UUID, int] = {}
+        dependents: Dict[UUID, List[UUID]] = {}
         
+        # Dependencies on tasks outside the workflow cannot form a cycle
         for task in self.tasks:
-            if task.id not in visited:
-                if has_cycle(task.id):
-                    return True
+            count = 0
+            for dep_id in task.dependencies:
+                if dep_id in tasks_by_id:
+                    count += 1
+                    dependents.setdefault(dep_id, []).append(task.id)
+            remaining[task.id] = count
+        
+        ready = deque(task_id for task_id, count in remaining.items() if count == 0)
+        emitted = 0
+        while ready:
+            task_id = ready.popleft()
+            emitted += 1
+            for dependent_id in dependents.get(task_id, ()):
+                remaining[dependent_id] -= 1
+                if remaining[dependent_id] == 0:
+                    ready.append(dependent_id)
         
-        return False
+        # Tasks never reaching zero remaining dependencies sit on a cycle
+        return emitted < len(remaining)
     
     def mark_ready(self) -> None:
         """Mark workflow as ready for execution after validation."""
@@ -241,71 +321,100 @@ class Workflow:
         if errors:
             raise ValueError(f"Workflow validation failed: {errors}")
 
+        self.index_dependencies()
         self.status = WorkflowStatus.READY
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert workflow to dictionary representation."""
+    def _native_dict(self, tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Field mapping with UUID, datetime and enum values left unconverted."""
+        result = self.result
         return {
-            "id": str(self.id),
+            "id": self.id,
             "name": self.name,
             "description": self.description,
-            "workflow_type": self.workflow_type.value,
-            "tasks": [task.to_dict() for task in self.tasks],
-            "agent_ids": [str(agent_id) for agent_id in self.agent_ids],
+            "workflow_type": self.workflow_type,
+            "tasks": tasks,
+            "agent_ids": self.agent_ids,
             "client_profile": self.client_profile,
             "target_audience": self.target_audience,
             "context": self.context,
-            "status": self.status.value,
+            "status": self.status,
             "result": {
-                "final_output": self.result.final_output,
-                "task_outputs": {str(k): v for k, v in self.result.task_outputs.items()},
-                "metadata": self.result.metadata,
-                "execution_time": self.result.execution_time,
-                "error_message": self.result.error_message
-            } if self.result else None,
-            "created_at": self.created_at.isoformat(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+                "final_output": result.final_output,
+                "task_outputs": result.task_outputs,
+                "metadata": result.metadata,
+                "execution_time": result.execution_time,
+                "error_message": result.error_message
+            } if result else None,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
             "metadata": self.metadata
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert workflow to dictionary representation."""
+        data = self._native_dict([task.to_dict() for task in self.tasks])
+        data["id"] = str(self.id)
+        data["workflow_type"] = self.workflow_type.value
+        data["agent_ids"] = list(map(str, self.agent_ids))
+        data["status"] = self.status.value
+        data["created_at"] = self.created_at.isoformat()
+        data["started_at"] = self.started_at.isoformat() if self.started_at else None
+        data["completed_at"] = self.completed_at.isoformat() if self.completed_at else None
+        return data
+
+    def to_json_bytes(self, indent: bool = False) -> bytes:
+        """Serialize workflow to JSON bytes; same document as ``to_dict``."""
+        data = self._native_dict([task._native_dict() for task in self.tasks])
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Workflow":
         """Create workflow from dictionary representation."""
-        from datetime import datetime
-        from uuid import UUID
-
+        fromisoformat = datetime.fromisoformat
+        workflow_type = data.get("workflow_type", "basic")
+        status = data.get("status", "draft")
+        
+        # Build tasks and agent ids in one pass, deduplicating like add_task
+        tasks: Dict[UUID, Task] = {}
+        for task_data in data.get("tasks", []):
+            task = Task.from_dict(task_data)
+            tasks.setdefault(task.id, task)
+        agent_ids = dict.fromkeys(UUID(agent_id) for agent_id in data.get("agent_ids", []))
+        agent_ids.update(dict.fromkeys(t.agent_id for t in tasks.values() if t.agent_id))
+        
         workflow = cls(
             id=UUID(data["id"]) if "id" in data else uuid4(),
             name=data.get("name", ""),
             description=data.get("description", ""),
-            workflow_type=WorkflowType(data.get("workflow_type", "basic")),
-            agent_ids=[UUID(agent_id) for agent_id in data.get("agent_ids", [])],
+            workflow_type=_WORKFLOW_TYPE_BY_VALUE.get(workflow_type) or WorkflowType(workflow_type),
+            tasks=list(tasks.values()),
+            agent_ids=list(agent_ids),
             client_profile=data.get("client_profile"),
             target_audience=data.get("target_audience", ""),
             context=data.get("context", {}),
-            status=WorkflowStatus(data.get("status", "draft")),
-            created_at=datetime.fromisoformat(data["created_at"]) if "created_at" in data else datetime.utcnow(),
-            started_at=datetime.fromisoformat(data["started_at"]) if data.get("started_at") else None,
-            completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
+            status=_WORKFLOW_STATUS_BY_VALUE.get(status) or WorkflowStatus(status),
+            created_at=fromisoformat(data["created_at"]) if "created_at" in data else datetime.utcnow(),
+            started_at=fromisoformat(data["started_at"]) if data.get("started_at") else None,
+            completed_at=fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
             metadata=data.get("metadata", {})
         )
 
-        # Add tasks
-        for task_data in data.get("tasks", []):
-            from .task import Task
-            task = Task.from_dict(task_data)
-            workflow.add_task(task)
-
         # Set result if present
         if data.get("result"):
             result_data = data["result"]
             workflow.result = WorkflowResult(
                 final_output=result_data.get("final_output", ""),
-                task_outputs={UUID(k): v for k, v in result_data.get("task_outputs", {}).items()},
+                task_outputs=result_data.get("task_outputs", {}),
                 metadata=result_data.get("metadata", {}),
                 execution_time=result_data.get("execution_time"),
                 error_message=result_data.get("error_message")
             )
 
         return workflow
+
+    @classmethod
+    def from_json_bytes(cls, raw: bytes) -> "Workflow":
+        """Create workflow from JSON produced by ``to_json_bytes``."""
+        return cls.from_dict(orjson.loads(raw))
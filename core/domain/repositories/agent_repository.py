@@ -1,5 +1,6 @@
 """Agent repository interface."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from uuid import UUID
@@ -41,6 +42,21 @@ class AgentRepository(ABC):
         """
         pass
     
+    async def get_many(self, agent_ids: List[UUID]) -> List[Optional[Agent]]:
+        """
+        Get several agents by ID.
+        
+        The default runs the get_by_id lookups concurrently; implementations
+        that can fetch many agents in a single read should override it.
+        
+        Args:
+            agent_ids: The agent IDs
+            
+        Returns:
+            The agents in the order of agent_ids, None for IDs not found
+        """
+        return list(await asyncio.gather(*(self.get_by_id(agent_id) for agent_id in agent_ids)))
+    
     @abstractmethod
     async def get_by_name(self, name: str) -> Optional[Agent]:
         """
@@ -1,5 +1,6 @@
 """Workflow repository interface."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from uuid import UUID
@@ -41,6 +42,21 @@ class WorkflowRepository(ABC):
         """
         pass
     
+    async def get_many(self, workflow_ids: List[UUID]) -> List[Optional[Workflow]]:
+        """
+        Get several workflows by ID.
+        
+        The default runs the get_by_id lookups concurrently; implementations
+        that can fetch many workflows in a single read should override it.
+        
+        Args:
+            workflow_ids: The workflow IDs
+            
+        Returns:
+            The workflows in the order of workflow_ids, None for IDs not found
+        """
+        return list(await asyncio.gather(*(self.get_by_id(workflow_id) for workflow_id in workflow_ids)))
+    
     @abstractmethod
     async def get_by_name(self, name: str) -> Optional[Workflow]:
         """
@@ -90,6 +106,20 @@ class WorkflowRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_paginated(self, limit: int, offset: int = 0) -> List[Workflow]:
+        """
+        Get a page of workflows, in the same order as get_all.
+        
+        Args:
+            limit: Maximum number of workflows to return
+            offset: Number of workflows to skip
+            
+        Returns:
+            List of at most `limit` workflows
+        """
+        pass
+    
     @abstractmethod
     async def get_templates(self) -> List[Workflow]:
         """
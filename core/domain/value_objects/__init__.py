@@ -2,6 +2,15 @@
 
 from .provider_config import ProviderConfig, LLMProvider
 from .client_profile import ClientProfile
-from .generation_params import GenerationParams
 
 __all__ = ["ProviderConfig", "LLMProvider", "ClientProfile", "GenerationParams"]
+
+
+def __getattr__(name):
+    # GenerationParams pulls in the entities package for its content enums,
+    # so it is only imported once something asks for it.
+    if name == "GenerationParams":
+        from .generation_params import GenerationParams
+        globals()["GenerationParams"] = GenerationParams
+        return GenerationParams
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
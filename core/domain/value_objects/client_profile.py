@@ -1,10 +1,18 @@
 """Client profile value object."""
 
-from dataclasses import dataclass
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 
+from .._compat import DATACLASS_SLOTS
 
-@dataclass(frozen=True)
+# Frozen dataclasses initialise derived fields through object.__setattr__
+_setattr = object.__setattr__
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ClientProfile:
     """
     Immutable client profile configuration.
@@ -22,59 +30,78 @@ class ClientProfile:
     target_audience: str = ""
     industry: str = ""
     company_background: str = ""
-    key_messages: List[str] = None
-    terminology: Dict[str, str] = None
-    content_preferences: Dict[str, Any] = None
+    key_messages: Tuple[str, ...] = None
+    terminology: Mapping[str, str] = None
+    content_preferences: Mapping[str, Any] = None
     rag_enabled: bool = True
     knowledge_base_path: Optional[str] = None
-    metadata: Dict[str, Any] = None
+    metadata: Mapping[str, Any] = None
+    _cached_hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    # Prompt context strings, built on first use
+    _brand_context: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _terminology_context: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # Merged content preferences per content type, built on first request
+    _preferences_by_type: Optional[Dict[str, Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __hash__(self) -> int:
+        """Hash the scalar and tuple fields once; dict fields are left out."""
+        if self._cached_hash is None:
+            _setattr(self, '_cached_hash', hash((
+                self.name, self.display_name, self.description, self.brand_voice,
+                self.style_guidelines, self.target_audience, self.industry,
+                self.company_background, self.key_messages, self.rag_enabled,
+                self.knowledge_base_path
+            )))
+        return self._cached_hash
+    
+    def __reduce__(self):
+        """Pickle through the constructor so the hash is recomputed per process."""
+        return (self.__class__, tuple(self.to_dict().values()))
     
     def __post_init__(self) -> None:
-        """Initialize default values for mutable fields."""
-        if self.key_messages is None:
-            object.__setattr__(self, 'key_messages', [])
+        """Initialize defaults and freeze the collection fields."""
+        _setattr(self, 'key_messages', tuple(self.key_messages) if self.key_messages else ())
         
-        if self.terminology is None:
-            object.__setattr__(self, 'terminology', {})
-        
-        if self.content_preferences is None:
-            object.__setattr__(self, 'content_preferences', {})
-        
-        if self.metadata is None:
-            object.__setattr__(self, 'metadata', {})
+        # Profiles are shared between callers, so the mappings are read-only
+        # copies; this also keeps the memoized context strings valid
+        for name in _MAPPING_FIELDS:
+            value = getattr(self, name)
+            _setattr(self, name, MappingProxyType(dict(value) if value else {}))
         
         if not self.display_name:
-            object.__setattr__(self, 'display_name', self.name.title())
+            _setattr(self, 'display_name', self.name.title())
         
         if self.rag_enabled and not self.knowledge_base_path:
-            object.__setattr__(self, 'knowledge_base_path', f"data/knowledge_base/{self.name}")
+            _setattr(self, 'knowledge_base_path', f"data/knowledge_base/{self.name}")
     
     def get_brand_context(self) -> str:
         """Get comprehensive brand context for content generation."""
-        context_parts = []
-        
-        if self.brand_voice:
-            context_parts.append(f"Brand Voice: {self.brand_voice}")
-        
-        if self.company_background:
-            context_parts.append(f"Company Background: {self.company_background}")
-        
-        if self.target_audience:
-            context_parts.append(f"Target Audience: {self.target_audience}")
-        
-        if self.industry:
-            context_parts.append(f"Industry: {self.industry}")
-        
-        if self.key_messages:
-            context_parts.append(f"Key Messages: {', '.join(self.key_messages)}")
-        
-        if self.style_guidelines:
-            context_parts.append(f"Style Guidelines: {self.style_guidelines}")
-        
-        return "\n\n".join(context_parts)
+        if self._brand_context is None:
+            _setattr(self, '_brand_context', self._build_brand_context())
+        return self._brand_context
+    
+    def _build_brand_context(self) -> str:
+        """Build the brand context string."""
+        context_parts = (
+            f"Brand Voice: {self.brand_voice}" if self.brand_voice else None,
+            f"Company Background: {self.company_background}" if self.company_background else None,
+            f"Target Audience: {self.target_audience}" if self.target_audience else None,
+            f"Industry: {self.industry}" if self.industry else None,
+            f"Key Messages: {', '.join(self.key_messages)}" if self.key_messages else None,
+            f"Style Guidelines: {self.style_guidelines}" if self.style_guidelines else None,
+        )
+        return "\n\n".join(part for part in context_parts if part)
     
     def get_terminology_context(self) -> str:
         """Get terminology context for consistent language use."""
+        if self._terminology_context is None:
+            _setattr(self, '_terminology_context', self._build_terminology_context())
+        return self._terminology_context
+    
+    def _build_terminology_context(self) -> str:
+        """Build the terminology context string."""
         if not self.terminology:
             return ""
         
@@ -84,18 +111,33 @@ class ClientProfile:
     def get_content_preferences(self, content_type: str = None) -> Dict[str, Any]:
         """Get content preferences, optionally filtered by content type."""
         if not content_type:
-            return self.content_preferences
-        
-        # Get general preferences and content-type specific ones
-        general_prefs = {k: v for k, v in self.content_preferences.items() 
-                        if not k.startswith(f"{content_type}_")}
-        
-        specific_prefs = {k.replace(f"{content_type}_", ""): v 
-                         for k, v in self.content_preferences.items() 
-                         if k.startswith(f"{content_type}_")}
+            return dict(self.content_preferences)
+        
+        if self._preferences_by_type is None:
+            _setattr(self, '_preferences_by_type', {})
+        preferences = self._preferences_by_type.get(content_type)
+        if preferences is None:
+            preferences = self._merge_content_preferences(content_type)
+            self._preferences_by_type[content_type] = preferences
+        # Hand out a copy so callers cannot alter the cached merge
+        return dict(preferences)
+    
+    def _merge_content_preferences(self, content_type: str) -> Dict[str, Any]:
+        """Merge general preferences with those prefixed by the content type."""
+        # Split general and content-type specific preferences in one pass
+        prefix = f"{content_type}_"
+        prefix_len = len(prefix)
+        preferences = {}
+        specific_prefs = {}
+        for k, v in self.content_preferences.items():
+            if k.startswith(prefix):
+                specific_prefs[k[prefix_len:]] = v
+            else:
+                preferences[k] = v
         
         # Merge with specific preferences taking priority
-        return {**general_prefs, **specific_prefs}
+        preferences.update(specific_prefs)
+        return preferences
     
     def has_rag_knowledge(self) -> bool:
         """Check if client has RAG knowledge base available."""
@@ -103,121 +145,80 @@ class ClientProfile:
     
     def with_rag_enabled(self, enabled: bool) -> "ClientProfile":
         """Create a new profile with RAG enabled/disabled."""
-        return ClientProfile(
-            name=self.name,
-            display_name=self.display_name,
-            description=self.description,
-            brand_voice=self.brand_voice,
-            style_guidelines=self.style_guidelines,
-            target_audience=self.target_audience,
-            industry=self.industry,
-            company_background=self.company_background,
-            key_messages=self.key_messages,
-            terminology=self.terminology,
-            content_preferences=self.content_preferences,
-            rag_enabled=enabled,
-            knowledge_base_path=self.knowledge_base_path,
-            metadata=self.metadata
-        )
+        return replace(self, rag_enabled=enabled)
     
     def with_knowledge_base_path(self, path: str) -> "ClientProfile":
         """Create a new profile with different knowledge base path."""
-        return ClientProfile(
-            name=self.name,
-            display_name=self.display_name,
-            description=self.description,
-            brand_voice=self.brand_voice,
-            style_guidelines=self.style_guidelines,
-            target_audience=self.target_audience,
-            industry=self.industry,
-            company_background=self.company_background,
-            key_messages=self.key_messages,
-            terminology=self.terminology,
-            content_preferences=self.content_preferences,
-            rag_enabled=self.rag_enabled,
-            knowledge_base_path=path,
-            metadata=self.metadata
-        )
+        return replace(self, knowledge_base_path=path)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
-        return {
-            "name": self.name,
-            "display_name": self.display_name,
-            "description": self.description,
-            "brand_voice": self.brand_voice,
-            "style_guidelines": self.style_guidelines,
-            "target_audience": self.target_audience,
-            "industry": self.industry,
-            "company_background": self.company_background,
-            "key_messages": self.key_messages,
-            "terminology": self.terminology,
-            "content_preferences": self.content_preferences,
-            "rag_enabled": self.rag_enabled,
-            "knowledge_base_path": self.knowledge_base_path,
-            "metadata": self.metadata
-        }
+        data = dict(zip(_INIT_FIELDS, _get_init_values(self)))
+        for name in _MAPPING_FIELDS:
+            data[name] = dict(data[name])
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ClientProfile":
         """Create from dictionary representation."""
-        return cls(
-            name=data["name"],
-            display_name=data.get("display_name", ""),
-            description=data.get("description", ""),
-            brand_voice=data.get("brand_voice", ""),
-            style_guidelines=data.get("style_guidelines", ""),
-            target_audience=data.get("target_audience", ""),
-            industry=data.get("industry", ""),
-            company_background=data.get("company_background", ""),
-            key_messages=data.get("key_messages", []),
-            terminology=data.get("terminology", {}),
-            content_preferences=data.get("content_preferences", {}),
-            rag_enabled=data.get("rag_enabled", True),
-            knowledge_base_path=data.get("knowledge_base_path"),
-            metadata=data.get("metadata", {})
-        )
+        return cls(**{k: v for k, v in data.items() if k in _INIT_FIELD_NAMES})
     
     @classmethod
     def create_default(cls, name: str) -> "ClientProfile":
         """Create a default client profile."""
-        return cls(
-            name=name,
-            description=f"Default profile for {name}",
-            target_audience="General audience",
-            rag_enabled=False
-        )
+        return _default_profile(name)
     
     @classmethod
     def create_siebert_profile(cls) -> "ClientProfile":
         """Create Siebert Financial client profile."""
-        return cls(
-            name="siebert",
-            display_name="Siebert Financial",
-            description="Financial services company focused on empowering individual investors",
-            brand_voice="Professional yet accessible, empowering, educational, trustworthy",
-            style_guidelines="Use clear, jargon-free language. Focus on education and empowerment. Maintain professional tone while being approachable.",
-            target_audience="Gen Z and young professionals interested in financial literacy and investing",
-            industry="Financial Services",
-            company_background="Founded by Muriel Siebert, the first woman to own a seat on the New York Stock Exchange. Family-owned business focused on democratizing finance.",
-            key_messages=[
-                "Financial empowerment for everyone",
-                "Breaking down barriers in finance",
-                "Education-first approach to investing",
-                "Family values in financial services"
-            ],
-            terminology={
-                "investing": "building wealth through strategic asset allocation",
-                "financial planning": "creating a roadmap for financial success",
-                "portfolio": "collection of investments designed to meet your goals"
-            },
-            content_preferences={
-                "tone": "educational and empowering",
-                "length": "800-1200 words for articles",
-                "newsletter_length": "600-800 words",
-                "include_statistics": True,
-                "include_actionable_tips": True
-            },
-            rag_enabled=True,
-            knowledge_base_path="data/knowledge_base/siebert"
-        )
+        return _SIEBERT_PROFILE
+
+
+# Constructor fields in declaration order, shared by to_dict, from_dict and pickling
+_INIT_FIELDS = tuple(f.name for f in fields(ClientProfile) if f.init)
+_get_init_values = attrgetter(*_INIT_FIELDS)
+_INIT_FIELD_NAMES = frozenset(_INIT_FIELDS)
+_MAPPING_FIELDS = ("terminology", "content_preferences", "metadata")
+
+
+@lru_cache(maxsize=32)
+def _default_profile(name: str) -> ClientProfile:
+    """Build the default profile for a client name once."""
+    return ClientProfile(
+        name=name,
+        description=f"Default profile for {name}",
+        target_audience="General audience",
+        rag_enabled=False
+    )
+
+
+_SIEBERT_PROFILE = ClientProfile(
+    name="siebert",
+    display_name="Siebert Financial",
+    description="Financial services company focused on empowering individual investors",
+    brand_voice="Professional yet accessible, empowering, educational, trustworthy",
+    style_guidelines="Use clear, jargon-free language. Focus on education and empowerment. Maintain professional tone while being approachable.",
+    target_audience="Gen Z and young professionals interested in financial literacy and investing",
+    industry="Financial Services",
+    company_background="Founded by Muriel Siebert, the first woman to own a seat on the New York Stock Exchange. Family-owned business focused on democratizing finance.",
+    key_messages=(
+        "Financial empowerment for everyone",
+        "Breaking down barriers in finance",
+        "Education-first approach to investing",
+        "Family values in financial services"
+    ),
+    terminology={
+        "investing": "building wealth through strategic asset allocation",
+        "financial planning": "creating a roadmap for financial success",
+        "portfolio": "collection of investments designed to meet your goals"
+    },
+    content_preferences={
+        "tone": "educational and empowering",
+        "length": "800-1200 words for articles",
+        "newsletter_length": "600-800 words",
+        "include_statistics": True,
+        "include_actionable_tips": True
+    },
+    rag_enabled=True,
+    knowledge_base_path="data/knowledge_base/siebert"
+)
@@ -1,10 +1,15 @@
 """Generation parameters value object."""
 
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, field, fields, replace
+from operator import attrgetter
+from typing import Dict, Any, Optional, Tuple
 from enum import Enum
 
 from ..entities.content import ContentType, ContentFormat
+from .._compat import DATACLASS_SLOTS
+
+# Frozen dataclasses initialise derived fields through object.__setattr__
+_setattr = object.__setattr__
 
 
 class GenerationMode(Enum):
@@ -15,7 +20,23 @@ class GenerationMode(Enum):
     CONVERSATIONAL = "conversational"
 
 
-@dataclass(frozen=True)
+_GENERATION_MODE_BY_VALUE: Dict[str, GenerationMode] = {m.value: m for m in GenerationMode}
+_CONTENT_TYPE_BY_VALUE: Dict[str, ContentType] = {t.value: t for t in ContentType}
+_CONTENT_FORMAT_BY_VALUE: Dict[str, ContentFormat] = {f.value: f for f in ContentFormat}
+
+_DEFAULT_WORD_COUNTS: Dict[ContentType, int] = {
+    ContentType.ARTICLE: 800,
+    ContentType.NEWSLETTER: 600,
+    ContentType.BLOG_POST: 1000,
+    ContentType.SOCIAL_MEDIA: 100,
+    ContentType.EMAIL: 300,
+    ContentType.REPORT: 1500,
+    ContentType.SUMMARY: 200,
+    ContentType.OTHER: 500
+}
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class GenerationParams:
     """
     Immutable parameters for content generation.
@@ -38,7 +59,7 @@ class GenerationParams:
     style: str = "informative"
     target_audience: str = "general"
     language: str = "en"
-    seo_keywords: list[str] = None
+    seo_keywords: Tuple[str, ...] = None
     custom_instructions: str = ""
     metadata: Dict[str, Any] = None
 
@@ -49,24 +70,46 @@ class GenerationParams:
     # Newsletter Premium specific parameters
     newsletter_topic: Optional[str] = None
     edition_number: Optional[int] = None
-    featured_sections: Optional[list] = None
+    featured_sections: Optional[Tuple[str, ...]] = None
+    _cached_hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    # Prompt context strings, built on first use
+    _generation_context: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _content_requirements: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __hash__(self) -> int:
+        """Hash the scalar and tuple fields once; dict fields are left out."""
+        if self._cached_hash is None:
+            _setattr(self, '_cached_hash', hash((
+                self.topic, self.content_type, self.content_format, self.generation_mode,
+                self.target_word_count, self.max_word_count, self.min_word_count,
+                self.include_sources, self.include_statistics, self.include_examples,
+                self.tone, self.style, self.target_audience, self.language,
+                self.seo_keywords, self.custom_instructions, self.target, self.context,
+                self.newsletter_topic, self.edition_number, self.featured_sections
+            )))
+        return self._cached_hash
+    
+    def __reduce__(self):
+        """Pickle through the constructor so the hash is recomputed per process."""
+        return (self.__class__, _get_init_values(self))
     
     def __post_init__(self) -> None:
         """Initialize default values and validate parameters."""
-        if self.seo_keywords is None:
-            object.__setattr__(self, 'seo_keywords', [])
+        _setattr(self, 'seo_keywords', tuple(self.seo_keywords) if self.seo_keywords else ())
 
         if self.metadata is None:
-            object.__setattr__(self, 'metadata', {})
+            _setattr(self, 'metadata', {})
 
-        if self.featured_sections is None:
-            object.__setattr__(self, 'featured_sections', [])
+        _setattr(self, 'featured_sections', tuple(self.featured_sections) if self.featured_sections else ())
         
         # Set default word counts based on content type
         if self.target_word_count is None:
-            object.__setattr__(self, 'target_word_count', self._get_default_word_count())
+            _setattr(self, 'target_word_count', self._get_default_word_count())
         
-        # Validate word count constraints
+        self.validate()
+    
+    def validate(self) -> None:
+        """Check the word count constraints, raising ValueError if they conflict."""
         if self.min_word_count and self.max_word_count:
             if self.min_word_count > self.max_word_count:
                 raise ValueError("Minimum word count cannot be greater than maximum word count")
@@ -79,17 +122,7 @@ class GenerationParams:
     
     def _get_default_word_count(self) -> int:
         """Get default word count based on content type."""
-        defaults = {
-            ContentType.ARTICLE: 800,
-            ContentType.NEWSLETTER: 600,
-            ContentType.BLOG_POST: 1000,
-            ContentType.SOCIAL_MEDIA: 100,
-            ContentType.EMAIL: 300,
-            ContentType.REPORT: 1500,
-            ContentType.SUMMARY: 200,
-            ContentType.OTHER: 500
-        }
-        return defaults.get(self.content_type, 500)
+        return _DEFAULT_WORD_COUNTS.get(self.content_type, 500)
     
     def get_word_count_range(self) -> tuple[Optional[int], Optional[int]]:
         """Get the word count range (min, max)."""
@@ -105,6 +138,12 @@ class GenerationParams:
     
     def get_generation_context(self) -> str:
         """Get formatted context for content generation."""
+        if self._generation_context is None:
+            _setattr(self, '_generation_context', self._build_generation_context())
+        return self._generation_context
+    
+    def _build_generation_context(self) -> str:
+        """Build the generation context string."""
         context_parts = [
             f"Topic: {self.topic}",
             f"Content Type: {self.content_type.value}",
@@ -127,6 +166,12 @@ class GenerationParams:
     
     def get_content_requirements(self) -> str:
         """Get formatted content requirements."""
+        if self._content_requirements is None:
+            _setattr(self, '_content_requirements', self._build_content_requirements())
+        return self._content_requirements
+    
+    def _build_content_requirements(self) -> str:
+        """Build the content requirements string."""
         requirements = []
         
         if self.include_sources:
@@ -153,89 +198,34 @@ class GenerationParams:
     
     def with_topic(self, topic: str) -> "GenerationParams":
         """Create new params with different topic."""
-        return GenerationParams(
-            topic=topic,
-            content_type=self.content_type,
-            content_format=self.content_format,
-            generation_mode=self.generation_mode,
-            target_word_count=self.target_word_count,
-            max_word_count=self.max_word_count,
-            min_word_count=self.min_word_count,
-            include_sources=self.include_sources,
-            include_statistics=self.include_statistics,
-            include_examples=self.include_examples,
-            tone=self.tone,
-            style=self.style,
-            target_audience=self.target_audience,
-            language=self.language,
-            seo_keywords=self.seo_keywords,
-            custom_instructions=self.custom_instructions,
-            metadata=self.metadata
-        )
+        return replace(self, topic=topic)
     
     def with_content_type(self, content_type: ContentType) -> "GenerationParams":
         """Create new params with different content type."""
-        return GenerationParams(
-            topic=self.topic,
-            content_type=content_type,
-            content_format=self.content_format,
-            generation_mode=self.generation_mode,
-            target_word_count=None,  # Will be recalculated
-            max_word_count=self.max_word_count,
-            min_word_count=self.min_word_count,
-            include_sources=self.include_sources,
-            include_statistics=self.include_statistics,
-            include_examples=self.include_examples,
-            tone=self.tone,
-            style=self.style,
-            target_audience=self.target_audience,
-            language=self.language,
-            seo_keywords=self.seo_keywords,
-            custom_instructions=self.custom_instructions,
-            metadata=self.metadata
-        )
+        return replace(self, content_type=content_type, target_word_count=None)  # Recalculated
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
-        return {
-            "topic": self.topic,
-            "content_type": self.content_type.value,
-            "content_format": self.content_format.value,
-            "generation_mode": self.generation_mode.value,
-            "target_word_count": self.target_word_count,
-            "max_word_count": self.max_word_count,
-            "min_word_count": self.min_word_count,
-            "include_sources": self.include_sources,
-            "include_statistics": self.include_statistics,
-            "include_examples": self.include_examples,
-            "tone": self.tone,
-            "style": self.style,
-            "target_audience": self.target_audience,
-            "language": self.language,
-            "seo_keywords": self.seo_keywords,
-            "custom_instructions": self.custom_instructions,
-            "metadata": self.metadata
-        }
+        data = dict(zip(_INIT_FIELDS, _get_init_values(self)))
+        data["content_type"] = self.content_type.value
+        data["content_format"] = self.content_format.value
+        data["generation_mode"] = self.generation_mode.value
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "GenerationParams":
         """Create from dictionary representation."""
-        return cls(
-            topic=data["topic"],
-            content_type=ContentType(data.get("content_type", "article")),
-            content_format=ContentFormat(data.get("content_format", "markdown")),
-            generation_mode=GenerationMode(data.get("generation_mode", "standard")),
-            target_word_count=data.get("target_word_count"),
-            max_word_count=data.get("max_word_count"),
-            min_word_count=data.get("min_word_count"),
-            include_sources=data.get("include_sources", True),
-            include_statistics=data.get("include_statistics", False),
-            include_examples=data.get("include_examples", True),
-            tone=data.get("tone", "professional"),
-            style=data.get("style", "informative"),
-            target_audience=data.get("target_audience", "general"),
-            language=data.get("language", "en"),
-            seo_keywords=data.get("seo_keywords", []),
-            custom_instructions=data.get("custom_instructions", ""),
-            metadata=data.get("metadata", {})
-        )
+        kwargs = {k: v for k, v in data.items() if k in _INIT_FIELD_NAMES}
+        content_type = kwargs.get("content_type", "article")
+        content_format = kwargs.get("content_format", "markdown")
+        generation_mode = kwargs.get("generation_mode", "standard")
+        kwargs["content_type"] = _CONTENT_TYPE_BY_VALUE.get(content_type) or ContentType(content_type)
+        kwargs["content_format"] = _CONTENT_FORMAT_BY_VALUE.get(content_format) or ContentFormat(content_format)
+        kwargs["generation_mode"] = _GENERATION_MODE_BY_VALUE.get(generation_mode) or GenerationMode(generation_mode)
+        return cls(**kwargs)
+
+
+# Constructor fields in declaration order, shared by to_dict, from_dict and pickling
+_INIT_FIELDS = tuple(f.name for f in fields(GenerationParams) if f.init)
+_get_init_values = attrgetter(*_INIT_FIELDS)
+_INIT_FIELD_NAMES = frozenset(_INIT_FIELDS)
@@ -1,9 +1,16 @@
 """Provider configuration value object."""
 
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, field, fields, replace
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, Mapping, Optional, Tuple
 from enum import Enum
 
+from .._compat import DATACLASS_SLOTS
+
+# Frozen dataclasses initialise derived fields through object.__setattr__
+_setattr = object.__setattr__
+
 
 class LLMProvider(Enum):
     """Supported LLM providers."""
@@ -12,7 +19,46 @@ class LLMProvider(Enum):
     DEEPSEEK = "deepseek"
 
 
-@dataclass(frozen=True)
+_LLM_PROVIDER_BY_VALUE: Dict[str, LLMProvider] = {p.value: p for p in LLMProvider}
+
+_DEFAULT_MODELS: Dict[LLMProvider, str] = {
+    LLMProvider.OPENAI: "gpt-4o",
+    LLMProvider.ANTHROPIC: "claude-3-5-sonnet-20241022",
+    LLMProvider.DEEPSEEK: "deepseek-chat"
+}
+
+_AVAILABLE_MODELS: Dict[LLMProvider, Tuple[str, ...]] = {
+    LLMProvider.OPENAI: (
+        "gpt-3.5-turbo",
+        "gpt-4",
+        "gpt-4-turbo",
+        "gpt-4o",
+        "gpt-4o-mini",
+        "o1",
+        "o1-mini",
+        "o1-pro",
+        "o3-mini"
+    ),
+    LLMProvider.ANTHROPIC: (
+        "claude-3-haiku-20240307",
+        "claude-3-sonnet-20240229",
+        "claude-3-opus-20240229",
+        "claude-3-5-sonnet-20241022",
+        "claude-3-5-haiku-20241022"
+    ),
+    LLMProvider.DEEPSEEK: (
+        "deepseek-chat",
+        "deepseek-coder"
+    )
+}
+
+# Membership sets for is_model_available
+_AVAILABLE_MODEL_SETS: Dict[LLMProvider, FrozenSet[str]] = {
+    provider: frozenset(models) for provider, models in _AVAILABLE_MODELS.items()
+}
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ProviderConfig:
     """
     Immutable configuration for LLM providers.
@@ -30,13 +76,35 @@ class ProviderConfig:
     presence_penalty: float = 0.0
     api_key: Optional[str] = None
     base_url: Optional[str] = None
-    additional_params: Dict[str, Any] = None
+    additional_params: Mapping[str, Any] = None
+    _cached_hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __hash__(self) -> int:
+        """Hash the scalar fields once; additional_params is left out."""
+        if self._cached_hash is None:
+            _setattr(self, '_cached_hash', hash((
+                self.provider, self.model, self.temperature, self.max_tokens, self.top_p,
+                self.frequency_penalty, self.presence_penalty, self.api_key, self.base_url
+            )))
+        return self._cached_hash
+    
+    def __reduce__(self):
+        """Pickle through the constructor so the hash is recomputed per process."""
+        return (self.__class__, tuple(self._init_dict().values()))
     
     def __post_init__(self) -> None:
-        """Validate configuration after initialization."""
-        if self.additional_params is None:
-            object.__setattr__(self, 'additional_params', {})
+        """Fill in defaults and validate configuration after initialization."""
+        # Read-only copy, so request params built from it cannot go stale
+        _setattr(self, 'additional_params', MappingProxyType(dict(self.additional_params or {})))
+        
+        self.validate()
         
+        # Set default model for provider if not specified
+        if not self.model:
+            _setattr(self, 'model', self._get_default_model())
+    
+    def validate(self) -> None:
+        """Check parameter ranges, raising ValueError on the first violation."""
         # Validate temperature
         if not 0.0 <= self.temperature <= 2.0:
             raise ValueError("Temperature must be between 0.0 and 2.0")
@@ -55,127 +123,52 @@ class ProviderConfig:
         # Validate max_tokens
         if self.max_tokens is not None and self.max_tokens <= 0:
             raise ValueError("Max tokens must be positive")
-        
-        # Set default model for provider if not specified
-        if not self.model:
-            object.__setattr__(self, 'model', self._get_default_model())
     
     def _get_default_model(self) -> str:
         """Get default model for the provider."""
-        defaults = {
-            LLMProvider.OPENAI: "gpt-4o",
-            LLMProvider.ANTHROPIC: "claude-3-5-sonnet-20241022",
-            LLMProvider.DEEPSEEK: "deepseek-chat"
-        }
-        return defaults.get(self.provider, "gpt-4o")
+        return _DEFAULT_MODELS.get(self.provider, "gpt-4o")
     
     def get_available_models(self) -> list[str]:
         """Get list of available models for the provider."""
-        models = {
-            LLMProvider.OPENAI: [
-                "gpt-3.5-turbo",
-                "gpt-4",
-                "gpt-4-turbo",
-                "gpt-4o",
-                "gpt-4o-mini",
-                "o1",
-                "o1-mini",
-                "o1-pro",
-                "o3-mini"
-            ],
-            LLMProvider.ANTHROPIC: [
-                "claude-3-haiku-20240307",
-                "claude-3-sonnet-20240229",
-                "claude-3-opus-20240229",
-                "claude-3-5-sonnet-20241022",
-                "claude-3-5-haiku-20241022"
-            ],
-            LLMProvider.DEEPSEEK: [
-                "deepseek-chat",
-                "deepseek-coder"
-            ]
-        }
-        return models.get(self.provider, [])
+        return list(_AVAILABLE_MODELS.get(self.provider, ()))
     
     def is_model_available(self) -> bool:
         """Check if the configured model is available for the provider."""
-        return self.model in self.get_available_models()
+        return self.model in _AVAILABLE_MODEL_SETS.get(self.provider, frozenset())
     
     def with_temperature(self, temperature: float) -> "ProviderConfig":
         """Create a new config with different temperature."""
-        return ProviderConfig(
-            provider=self.provider,
-            model=self.model,
-            temperature=temperature,
-            max_tokens=self.max_tokens,
-            top_p=self.top_p,
-            frequency_penalty=self.frequency_penalty,
-            presence_penalty=self.presence_penalty,
-            api_key=self.api_key,
-            base_url=self.base_url,
-            additional_params=self.additional_params
-        )
+        return replace(self, temperature=temperature)
     
     def with_model(self, model: str) -> "ProviderConfig":
         """Create a new config with different model."""
-        return ProviderConfig(
-            provider=self.provider,
-            model=model,
-            temperature=self.temperature,
-            max_tokens=self.max_tokens,
-            top_p=self.top_p,
-            frequency_penalty=self.frequency_penalty,
-            presence_penalty=self.presence_penalty,
-            api_key=self.api_key,
-            base_url=self.base_url,
-            additional_params=self.additional_params
-        )
+        return replace(self, model=model)
     
     def with_provider(self, provider: LLMProvider) -> "ProviderConfig":
         """Create a new config with different provider and default model."""
-        return ProviderConfig(
-            provider=provider,
-            model="",  # Will be set to default in __post_init__
-            temperature=self.temperature,
-            max_tokens=self.max_tokens,
-            top_p=self.top_p,
-            frequency_penalty=self.frequency_penalty,
-            presence_penalty=self.presence_penalty,
-            api_key=self.api_key,
-            base_url=self.base_url,
-            additional_params=self.additional_params
-        )
+        return replace(self, provider=provider, model="")  # Default model set in __post_init__
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
-        return {
-            "provider": self.provider.value,
-            "model": self.model,
-            "temperature": self.temperature,
-            "max_tokens": self.max_tokens,
-            "top_p": self.top_p,
-            "frequency_penalty": self.frequency_penalty,
-            "presence_penalty": self.presence_penalty,
-            "api_key": self.api_key,
-            "base_url": self.base_url,
-            "additional_params": self.additional_params
-        }
+        data = self._init_dict()
+        data["provider"] = self.provider.value
+        return data
+    
+    def _init_dict(self) -> Dict[str, Any]:
+        """Map constructor fields to their values, with additional_params as a dict."""
+        data = dict(zip(_INIT_FIELDS, _get_init_values(self)))
+        data["additional_params"] = dict(self.additional_params)
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ProviderConfig":
         """Create from dictionary representation."""
-        return cls(
-            provider=LLMProvider(data.get("provider", "openai")),
-            model=data.get("model", ""),
-            temperature=data.get("temperature", 0.7),
-            max_tokens=data.get("max_tokens"),
-            top_p=data.get("top_p", 1.0),
-            frequency_penalty=data.get("frequency_penalty", 0.0),
-            presence_penalty=data.get("presence_penalty", 0.0),
-            api_key=data.get("api_key"),
-            base_url=data.get("base_url"),
-            additional_params=data.get("additional_params", {})
-        )
+        kwargs = {k: v for k, v in data.items() if k in _INIT_FIELD_NAMES}
+        provider = kwargs.get("provider", "openai")
+        kwargs["provider"] = _LLM_PROVIDER_BY_VALUE.get(provider) or LLMProvider(provider)
+        # A missing model resolves to the provider's default in __post_init__
+        kwargs.setdefault("model", "")
+        return cls(**kwargs)
     
     @classmethod
     def create_openai_config(cls, model: str = "gpt-4o", temperature: float = 0.7) -> "ProviderConfig":
@@ -203,3 +196,9 @@ class ProviderConfig:
             model=model,
             temperature=temperature
         )
+
+
+# Constructor fields in declaration order, shared by to_dict, from_dict and pickling
+_INIT_FIELDS = tuple(f.name for f in fields(ProviderConfig) if f.init)
+_get_init_values = attrgetter(*_INIT_FIELDS)
+_INIT_FIELD_NAMES = frozenset(_INIT_FIELDS)
@@ -2,8 +2,11 @@
 
 import os
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
+from . import envs
+
 
 class Environment(Enum):
     """Application environments."""
@@ -13,13 +16,15 @@ class Environment(Enum):
     PRODUCTION = "production"
 
 
+_ENVIRONMENT_BY_VALUE = {e.value: e for e in Environment}
+
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
+
+@lru_cache(maxsize=None)
 def get_environment() -> Environment:
     """Get current environment from environment variable."""
-    env_str = os.getenv("ENVIRONMENT", "development").lower()
-    try:
-        return Environment(env_str)
-    except ValueError:
-        return Environment.DEVELOPMENT
+    return _ENVIRONMENT_BY_VALUE.get(envs.ENVIRONMENT, Environment.DEVELOPMENT)
 
 
 def is_development() -> bool:
@@ -37,17 +42,19 @@ def is_testing() -> bool:
     return get_environment() == Environment.TESTING
 
 
+@lru_cache(maxsize=256)
 def get_env_var(key: str, default: Optional[str] = None) -> Optional[str]:
     """Get environment variable with optional default."""
     return os.getenv(key, default)
 
 
+@lru_cache(maxsize=256)
 def get_env_var_bool(key: str, default: bool = False) -> bool:
     """Get boolean environment variable."""
-    value = os.getenv(key, str(default)).lower()
-    return value in ("true", "1", "yes", "on")
+    return os.getenv(key, str(default)).strip().lower() in _TRUTHY
 
 
+@lru_cache(maxsize=256)
 def get_env_var_int(key: str, default: int = 0) -> int:
     """Get integer environment variable."""
     try:
@@ -56,9 +63,17 @@ def get_env_var_int(key: str, default: int = 0) -> int:
         return default
 
 
+@lru_cache(maxsize=256)
 def get_env_var_float(key: str, default: float = 0.0) -> float:
     """Get float environment variable."""
     try:
         return float(os.getenv(key, str(default)))
     except ValueError:
         return default
+
+
+def clear_env_cache() -> None:
+    """Forget cached values so changes to os.environ are picked up (e.g. in tests)."""
+    for helper in (get_environment, get_env_var, get_env_var_bool, get_env_var_int, get_env_var_float):
+        helper.cache_clear()
+    envs.clear_cache()
@@ -0,0 +1,40 @@
+"""
+Raw environment variables, read lazily on first access.
+
+Each variable is declared once here with its parser and default. Access it
+as a module attribute (``envs.ENVIRONMENT``); the value is computed on
+first use and cached until ``clear_cache()`` is called. Unlike ``Settings``
+this does not read ``.env`` files or run Pydantic validation, so it suits
+code that only needs a single variable. Only variables read outside
+``Settings`` belong here; typed parsing of arbitrary keys is provided by
+the ``get_env_var_*`` helpers in ``environment``.
+"""
+
+import os
+from typing import Any, Callable, Dict
+
+
+environment_variables: Dict[str, Callable[[], Any]] = {
+    "ENVIRONMENT": lambda: os.getenv("ENVIRONMENT", "development").lower(),
+}
+
+_values: Dict[str, Any] = {}
+
+
+def __getattr__(name: str) -> Any:
+    if name in environment_variables:
+        try:
+            return _values[name]
+        except KeyError:
+            value = _values[name] = environment_variables[name]()
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return list(environment_variables.keys())
+
+
+def clear_cache() -> None:
+    """Forget cached values so changes to os.environ are picked up."""
+    _values.clear()
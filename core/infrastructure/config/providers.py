@@ -1,7 +1,8 @@
 """Provider-specific configuration."""
 
-from typing import Dict, Any, Optional
-from pydantic import BaseModel
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Mapping, Optional, Tuple
+from pydantic import BaseModel, PrivateAttr
 
 from ...domain.value_objects.provider_config import ProviderConfig, LLMProvider
 
@@ -24,40 +25,43 @@ class ProviderSettings(BaseModel):
     deepseek_base_url: Optional[str] = None
     deepseek_default_model: str = "deepseek-chat"
     
-    def get_provider_config(self, provider: LLMProvider) -> ProviderConfig:
-        """Get provider configuration for specific provider."""
-        if provider == LLMProvider.OPENAI:
-            return ProviderConfig(
-                provider=provider,
-                model=self.openai_default_model,
-                api_key=self.openai_api_key,
-                base_url=self.openai_base_url
-            )
-        elif provider == LLMProvider.ANTHROPIC:
-            return ProviderConfig(
-                provider=provider,
-                model=self.anthropic_default_model,
-                api_key=self.anthropic_api_key,
-                base_url=self.anthropic_base_url
-            )
-        elif provider == LLMProvider.DEEPSEEK:
-            return ProviderConfig(
-                provider=provider,
-                model=self.deepseek_default_model,
-                api_key=self.deepseek_api_key,
-                base_url=self.deepseek_base_url
-            )
-        else:
-            raise ValueError(f"Unsupported provider: {provider}")
+    # (default model, API key, base URL) attribute names per provider
+    _PROVIDER_FIELDS: ClassVar[Dict[LLMProvider, Tuple[str, str, str]]] = {
+        LLMProvider.OPENAI: ("openai_default_model", "openai_api_key", "openai_base_url"),
+        LLMProvider.ANTHROPIC: ("anthropic_default_model", "anthropic_api_key", "anthropic_base_url"),
+        LLMProvider.DEEPSEEK: ("deepseek_default_model", "deepseek_api_key", "deepseek_base_url")
+    }
     
-    def get_available_providers(self) -> Dict[str, bool]:
-        """Get available providers based on API keys."""
-        return {
+    # Provider availability derived from the API keys once at construction
+    _available_providers: Mapping[str, bool] = PrivateAttr()
+    _has_any_provider: bool = PrivateAttr()
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute provider availability."""
+        self._available_providers = MappingProxyType({
             "openai": bool(self.openai_api_key),
             "anthropic": bool(self.anthropic_api_key),
             "deepseek": bool(self.deepseek_api_key)
-        }
+        })
+        self._has_any_provider = bool(self.openai_api_key or self.anthropic_api_key or self.deepseek_api_key)
+    
+    def get_provider_config(self, provider: LLMProvider) -> ProviderConfig:
+        """Get provider configuration for specific provider."""
+        provider_fields = self._PROVIDER_FIELDS.get(provider)
+        if provider_fields is None:
+            raise ValueError(f"Unsupported provider: {provider}")
+        model_attr, api_key_attr, base_url_attr = provider_fields
+        return ProviderConfig(
+            provider=provider,
+            model=getattr(self, model_attr),
+            api_key=getattr(self, api_key_attr),
+            base_url=getattr(self, base_url_attr)
+        )
+    
+    def get_available_providers(self) -> Mapping[str, bool]:
+        """Get available providers based on API keys (read-only)."""
+        return self._available_providers
     
     def has_any_provider(self) -> bool:
         """Check if at least one provider is configured."""
-        return any(self.get_available_providers().values())
+        return self._has_any_provider
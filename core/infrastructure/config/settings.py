@@ -1,12 +1,15 @@
 """Application settings configuration."""
 
 import os
-from typing import Optional, Dict, Any
-from pathlib import Path
-from pydantic import Field
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
+from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
+# Directories already created by this process, shared across Settings instances
+_ensured_directories: set = set()
+
 
 class Settings(BaseSettings):
     """
@@ -81,6 +84,15 @@ class Settings(BaseSettings):
     websocket_enabled: bool = Field(default=True, env="WEBSOCKET_ENABLED")
     websocket_path: str = Field(default="/ws", env="WEBSOCKET_PATH")
     
+    # Provider lookups derived from the API keys once at construction
+    _available_providers: Mapping[str, bool] = PrivateAttr()
+    _has_any_provider: bool = PrivateAttr()
+    _provider_keys: Dict[str, Optional[str]] = PrivateAttr()
+    _chroma_settings: Mapping[str, Any] = PrivateAttr()
+    _logging_config: Dict[str, Any] = PrivateAttr()
+    _is_production: bool = PrivateAttr()
+    _is_development: bool = PrivateAttr()
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -88,6 +100,43 @@ class Settings(BaseSettings):
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        environment = self.environment.lower()
+        self._is_production = environment == "production"
+        self._is_development = environment == "development"
+        self._provider_keys = {
+            "openai": self.openai_api_key,
+            "anthropic": self.anthropic_api_key,
+            "deepseek": self.deepseek_api_key
+        }
+        self._available_providers = MappingProxyType(
+            {name: bool(key) for name, key in self._provider_keys.items()}
+        )
+        self._has_any_provider = bool(self.openai_api_key or self.anthropic_api_key or self.deepseek_api_key)
+        self._chroma_settings = MappingProxyType({
+            "host": self.chroma_host,
+            "port": self.chroma_port,
+            "persist_directory": self.chroma_persist_directory
+        })
+        self._logging_config = {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "formatters": {
+                "default": {
+                    "format": self.log_format,
+                },
+            },
+            "handlers": {
+                "default": {
+                    "formatter": "default",
+                    "class": "logging.StreamHandler",
+                    "stream": "ext://sys.stdout",
+                },
+            },
+            "root": {
+                "level": self.log_level,
+                "handlers": ["default"],
+            },
+        }
         self._ensure_directories()
     
     def _ensure_directories(self) -> None:
@@ -103,71 +152,47 @@ class Settings(BaseSettings):
         ]
         
         for directory in directories:
-            Path(directory).mkdir(parents=True, exist_ok=True)
-    
-    def get_available_providers(self) -> Dict[str, bool]:
-        """Get available AI providers based on API keys."""
-        return {
-            "openai": bool(self.openai_api_key),
-            "anthropic": bool(self.anthropic_api_key),
-            "deepseek": bool(self.deepseek_api_key)
-        }
+            if directory not in _ensured_directories:
+                os.makedirs(directory, exist_ok=True)
+                _ensured_directories.add(directory)
+    
+    def get_available_providers(self) -> Mapping[str, bool]:
+        """Get available AI providers based on API keys (read-only)."""
+        return self._available_providers
     
     def has_any_provider(self) -> bool:
         """Check if at least one AI provider is configured."""
-        return any(self.get_available_providers().values())
+        return self._has_any_provider
     
     def get_provider_api_key(self, provider: str) -> Optional[str]:
         """Get API key for specific provider."""
-        provider_keys = {
-            "openai": self.openai_api_key,
-            "anthropic": self.anthropic_api_key,
-            "deepseek": self.deepseek_api_key
-        }
-        return provider_keys.get(provider.lower())
+        return self._provider_keys.get(provider.lower())
     
     def is_production(self) -> bool:
         """Check if running in production environment."""
-        return self.environment.lower() == "production"
+        return self._is_production
     
     def is_development(self) -> bool:
         """Check if running in development environment."""
-        return self.environment.lower() == "development"
+        return self._is_development
     
     def get_database_url(self) -> str:
         """Get database URL with proper formatting."""
         return self.database_url
     
-    def get_chroma_settings(self) -> Dict[str, Any]:
-        """Get ChromaDB settings."""
-        return {
-            "host": self.chroma_host,
-            "port": self.chroma_port,
-            "persist_directory": self.chroma_persist_directory
-        }
+    def get_chroma_settings(self) -> Mapping[str, Any]:
+        """Get ChromaDB settings (read-only)."""
+        return self._chroma_settings
     
     def get_logging_config(self) -> Dict[str, Any]:
-        """Get logging configuration."""
-        return {
-            "version": 1,
-            "disable_existing_loggers": False,
-            "formatters": {
-                "default": {
-                    "format": self.log_format,
-                },
-            },
-            "handlers": {
-                "default": {
-                    "formatter": "default",
-                    "class": "logging.StreamHandler",
-                    "stream": "ext://sys.stdout",
-                },
-            },
-            "root": {
-                "level": self.log_level,
-                "handlers": ["default"],
-            },
-        }
+        """
+        Get logging configuration.
+        
+        The same dict is returned on every call; treat it as read-only. It is
+        a plain dict rather than a MappingProxyType because dictConfig only
+        accepts real dicts for the nested sections.
+        """
+        return self._logging_config
 
 
 @lru_cache()
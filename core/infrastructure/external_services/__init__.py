@@ -1,7 +1,17 @@
 """External service adapters."""
 
-from .openai_adapter import OpenAIAdapter
 from .anthropic_adapter import AnthropicAdapter
 from .deepseek_adapter import DeepSeekAdapter
+from ._http import aclose_shared_http_client
 
-__all__ = ["OpenAIAdapter", "AnthropicAdapter", "DeepSeekAdapter"]
+__all__ = ["OpenAIAdapter", "AnthropicAdapter", "DeepSeekAdapter", "aclose_shared_http_client"]
+
+
+def __getattr__(name):
+    # The OpenAI adapter is resolved on first access so importing this
+    # package does not load its module until it is needed.
+    if name == "OpenAIAdapter":
+        from .openai_adapter import OpenAIAdapter
+        globals()["OpenAIAdapter"] = OpenAIAdapter
+        return OpenAIAdapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
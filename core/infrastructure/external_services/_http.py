@@ -0,0 +1,57 @@
+"""HTTP connection pool shared by the LLM adapters."""
+
+import asyncio
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import httpx
+
+_shared_client: Optional["httpx.AsyncClient"] = None
+# Event loop the shared client's connections belong to
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Get the running event loop, or None outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def get_shared_http_client() -> "httpx.AsyncClient":
+    """
+    Get the process-wide async HTTP client.
+
+    Every OpenAI-compatible client built by the adapters sends requests
+    through this one client, so they share a single pool of keep-alive
+    connections instead of each opening their own. Pooled connections
+    belong to the loop that opened them, so a new client is created when
+    the running loop changes (e.g. a second ``asyncio.run``).
+    """
+    global _shared_client, _shared_loop
+    loop = _running_loop()
+    if _shared_client is None or _shared_client.is_closed or loop is not _shared_loop:
+        import httpx
+
+        transport = httpx.AsyncHTTPTransport(
+            retries=2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+        # A client left on a previous loop cannot be closed from this one;
+        # it is dropped along with its connections
+        _shared_client = httpx.AsyncClient(transport=transport)
+        _shared_loop = loop
+    return _shared_client
+
+
+async def aclose_shared_http_client() -> None:
+    """Close the shared client's connections; the next request opens a new one."""
+    global _shared_client, _shared_loop
+    client = _shared_client
+    if client is None:
+        return
+    _shared_client = None
+    if _shared_loop is None or _shared_loop is _running_loop():
+        await client.aclose()
+    _shared_loop = None
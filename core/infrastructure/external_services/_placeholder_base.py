@@ -0,0 +1,96 @@
+"""Shared base for LLM adapters that are not implemented yet."""
+
+import logging
+from typing import Dict, List, Optional, Any, AsyncGenerator
+
+from ...application.interfaces.llm_provider_interface import (
+    LLMProviderInterface, 
+    LLMResponse, 
+    LLMStreamChunk
+)
+from ...domain.value_objects.provider_config import ProviderConfig, LLMProvider
+
+logger = logging.getLogger(__name__)
+
+
+class _PlaceholderAdapter(LLMProviderInterface):
+    """
+    Placeholder implementation of LLMProviderInterface.
+    
+    Subclasses only set the provider they stand in for; every call returns
+    canned content so the rest of the pipeline can run without the real API.
+    """
+    
+    __slots__ = ("api_key",)
+    
+    _provider: LLMProvider
+    _display_name: str
+    
+    def __init__(self, api_key: Optional[str] = None):
+        self.api_key = api_key
+    
+    async def generate_content(
+        self, 
+        prompt: str, 
+        config: ProviderConfig,
+        system_message: Optional[str] = None
+    ) -> str:
+        """Generate placeholder content."""
+        logger.warning("%s adapter not fully implemented", self._display_name)
+        return f"Generated content for: {prompt[:50]}..."
+    
+    async def generate_content_detailed(
+        self, 
+        prompt: str, 
+        config: ProviderConfig,
+        system_message: Optional[str] = None
+    ) -> LLMResponse:
+        """Generate content with detailed response."""
+        content = await self.generate_content(prompt, config, system_message)
+        return LLMResponse(
+            content=content,
+            model=config.model,
+            finish_reason="completed"
+        )
+    
+    async def generate_content_stream(
+        self, 
+        prompt: str, 
+        config: ProviderConfig,
+        system_message: Optional[str] = None
+    ) -> AsyncGenerator[LLMStreamChunk, None]:
+        """Generate content with streaming response."""
+        content = await self.generate_content(prompt, config, system_message)
+        yield LLMStreamChunk(content=content, is_final=True)
+    
+    async def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        config: ProviderConfig
+    ) -> LLMResponse:
+        """Perform chat completion."""
+        return LLMResponse(
+            content="Chat response placeholder",
+            model=config.model,
+            finish_reason="completed"
+        )
+    
+    async def validate_config(self, config: ProviderConfig) -> bool:
+        """Validate the provider configuration."""
+        return config.provider == self._provider and bool(self.api_key)
+    
+    async def get_available_models(self, config: ProviderConfig) -> List[str]:
+        """Get available models for the provider."""
+        return config.get_available_models()
+    
+    async def estimate_tokens(self, text: str, model: str) -> int:
+        """Estimate token count."""
+        return int(len(text.split()) * 1.3)
+    
+    async def check_health(self, config: ProviderConfig) -> Dict[str, Any]:
+        """Check provider service health."""
+        return {
+            "status": "healthy" if self.api_key else "unhealthy",
+            "provider": self._provider.value,
+            "api_key_valid": bool(self.api_key)
+        }
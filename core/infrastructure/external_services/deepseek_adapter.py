@@ -1,19 +1,10 @@
 """DeepSeek service adapter."""
 
-import logging
-from typing import Dict, List, Optional, Any, AsyncGenerator
+from ._placeholder_base import _PlaceholderAdapter
+from ...domain.value_objects.provider_config import LLMProvider
 
-from ...application.interfaces.llm_provider_interface import (
-    LLMProviderInterface, 
-    LLMResponse, 
-    LLMStreamChunk
-)
-from ...domain.value_objects.provider_config import ProviderConfig, LLMProvider
 
-logger = logging.getLogger(__name__)
-
-
-class DeepSeekAdapter(LLMProviderInterface):
+class DeepSeekAdapter(_PlaceholderAdapter):
     """
     DeepSeek service adapter implementing LLMProviderInterface.
     
@@ -21,73 +12,7 @@ class DeepSeekAdapter(LLMProviderInterface):
     Note: This is a placeholder implementation.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
-        self.api_key = api_key
-    
-    async def generate_content(
-        self, 
-        prompt: str, 
-        config: ProviderConfig,
-        system_message: Optional[str] = None
-    ) -> str:
-        """Generate content using DeepSeek."""
-        # Placeholder implementation
-        logger.warning("DeepSeek adapter not fully implemented")
-        return f"Generated content for: {prompt[:50]}..."
-    
-    async def generate_content_detailed(
-        self, 
-        prompt: str, 
-        config: ProviderConfig,
-        system_message: Optional[str] = None
-    ) -> LLMResponse:
-        """Generate content with detailed response."""
-        content = await self.generate_content(prompt, config, system_message)
-        return LLMResponse(
-            content=content,
-            model=config.model,
-            finish_reason="completed"
-        )
-    
-    async def generate_content_stream(
-        self, 
-        prompt: str, 
-        config: ProviderConfig,
-        system_message: Optional[str] = None
-    ) -> AsyncGenerator[LLMStreamChunk, None]:
-        """Generate content with streaming response."""
-        content = await self.generate_content(prompt, config, system_message)
-        yield LLMStreamChunk(content=content, is_final=True)
-    
-    async def chat_completion(
-        self,
-        messages: List[Dict[str, str]],
-        config: ProviderConfig
-    ) -> LLMResponse:
-        """Perform chat completion."""
-        # Placeholder implementation
-        return LLMResponse(
-            content="Chat response placeholder",
-            model=config.model,
-            finish_reason="completed"
-        )
-    
-    async def validate_config(self, config: ProviderConfig) -> bool:
-        """Validate DeepSeek configuration."""
-        return config.provider == LLMProvider.DEEPSEEK and bool(self.api_key)
-    
-    async def get_available_models(self, config: ProviderConfig) -> List[str]:
-        """Get available DeepSeek models."""
-        return config.get_available_models()
-    
-    async def estimate_tokens(self, text: str, model: str) -> int:
-        """Estimate token count."""
-        return len(text.split()) * 1.3
+    __slots__ = ()
     
-    async def check_health(self, config: ProviderConfig) -> Dict[str, Any]:
-        """Check DeepSeek service health."""
-        return {
-            "status": "healthy" if self.api_key else "unhealthy",
-            "provider": "deepseek",
-            "api_key_valid": bool(self.api_key)
-        }
+    _provider = LLMProvider.DEEPSEEK
+    _display_name = "DeepSeek"
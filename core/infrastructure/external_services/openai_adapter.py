@@ -1,9 +1,12 @@
 """OpenAI service adapter."""
 
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any, AsyncGenerator
-import openai
-from openai import AsyncOpenAI
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Any, AsyncGenerator, Tuple
 
 from ...application.interfaces.llm_provider_interface import (
     LLMProviderInterface, 
@@ -11,9 +14,59 @@ from ...application.interfaces.llm_provider_interface import (
     LLMStreamChunk
 )
 from ...domain.value_objects.provider_config import ProviderConfig, LLMProvider
+from ._http import get_shared_http_client
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
+# Clients (and their connection pools) kept warm per (api_key, base_url)
+_CLIENT_CACHE_MAXSIZE = 8
+
+# Seconds allowed for the models.list() probe in validate_config
+_VALIDATION_TIMEOUT_SECONDS = 2.0
+
+# How long a fetched model list is reused before asking the API again
+_MODELS_CACHE_TTL_SECONDS = 600.0
+
+# How long a successful validate_config result is trusted, so revoked keys are noticed
+_VALIDATION_CACHE_TTL_SECONDS = 600.0
+
+# Responses kept for repeated deterministic (temperature 0) requests
+_RESPONSE_CACHE_MAXSIZE = 256
+
+# Per-config request parameters kept by each adapter
+_REQUEST_PARAMS_CACHE_MAXSIZE = 64
+
+
+def _build_messages(prompt: str, system_message: Optional[str]) -> List[Dict[str, str]]:
+    """Build the chat messages for a prompt with an optional system message."""
+    if system_message:
+        return [
+            {"role": "system", "content": system_message},
+            {"role": "user", "content": prompt}
+        ]
+    return [{"role": "user", "content": prompt}]
+
+
+def _build_request_params(config: ProviderConfig) -> Mapping[str, Any]:
+    """Build the chat completion parameters for a config (read-only)."""
+    params = {
+        "model": config.model,
+        "temperature": config.temperature,
+        "top_p": config.top_p,
+        "frequency_penalty": config.frequency_penalty,
+        "presence_penalty": config.presence_penalty,
+    }
+    
+    if config.max_tokens:
+        params["max_tokens"] = config.max_tokens
+    
+    # Add any additional parameters
+    params.update(config.additional_params)
+    return MappingProxyType(params)
+
 
 class OpenAIAdapter(LLMProviderInterface):
     """
@@ -23,25 +76,63 @@ class OpenAIAdapter(LLMProviderInterface):
     providing a clean interface for the application layer.
     """
     
+    __slots__ = (
+        "api_key", "_clients", "_validated", "_models_cache", "_response_cache", "_request_params"
+    )
+    
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key
-        self._client: Optional[AsyncOpenAI] = None
+        # LRU of clients: (api_key, base_url) -> (http client it was built on, client)
+        self._clients: "OrderedDict[Tuple[str, Optional[str]], Tuple[Any, AsyncOpenAI]]" = OrderedDict()
+        # (api_key, base_url) -> time it last passed validate_config
+        self._validated: Dict[Tuple[str, Optional[str]], float] = {}
+        # (api_key, base_url) -> (fetched_at, model ids)
+        self._models_cache: Dict[Tuple[str, Optional[str]], Tuple[float, Tuple[str, ...]]] = {}
+        # LRU of deterministic responses: (config, prompt, system_message) -> response
+        self._response_cache: "OrderedDict[Tuple[ProviderConfig, str, Optional[str]], LLMResponse]" = OrderedDict()
+        # LRU of chat completion parameters per config
+        self._request_params: "OrderedDict[ProviderConfig, Mapping[str, Any]]" = OrderedDict()
     
-    def _get_client(self, config: ProviderConfig) -> AsyncOpenAI:
+    def _base_request_params(self, config: ProviderConfig) -> Mapping[str, Any]:
+        """Get the chat completion parameters for a config, building them once."""
+        params = self._request_params.get(config)
+        if params is not None:
+            self._request_params.move_to_end(config)
+            return params
+        
+        params = self._request_params[config] = _build_request_params(config)
+        if len(self._request_params) > _REQUEST_PARAMS_CACHE_MAXSIZE:
+            self._request_params.popitem(last=False)
+        return params
+    
+    def _get_client(self, config: ProviderConfig) -> "AsyncOpenAI":
         """Get or create OpenAI client."""
-        if self._client is None or config.api_key != self.api_key:
-            api_key = config.api_key or self.api_key
-            if not api_key:
-                raise ValueError("OpenAI API key is required")
-            
-            client_kwargs = {"api_key": api_key}
-            if config.base_url:
-                client_kwargs["base_url"] = config.base_url
-            
-            self._client = AsyncOpenAI(**client_kwargs)
-            self.api_key = api_key
+        api_key = config.api_key or self.api_key
+        if not api_key:
+            raise ValueError("OpenAI API key is required")
+        
+        key = (api_key, config.base_url)
+        http_client = get_shared_http_client()
+        entry = self._clients.get(key)
+        # Clients built on a shared HTTP client that has since been replaced
+        # (closed, or left behind on another event loop) are rebuilt
+        if entry is not None and entry[0] is http_client:
+            self._clients.move_to_end(key)
+            return entry[1]
+        
+        client_kwargs = {"api_key": api_key, "http_client": http_client}
+        if config.base_url:
+            client_kwargs["base_url"] = config.base_url
+        
+        # The SDK is imported on first use to keep it off the import path
+        from openai import AsyncOpenAI
         
-        return self._client
+        client = AsyncOpenAI(**client_kwargs)
+        self._clients[key] = (http_client, client)
+        self._clients.move_to_end(key)
+        if len(self._clients) > _CLIENT_CACHE_MAXSIZE:
+            self._clients.popitem(last=False)
+        return client
     
     async def generate_content(
         self, 
@@ -65,27 +156,18 @@ class OpenAIAdapter(LLMProviderInterface):
         
         client = self._get_client(config)
         
-        # Build messages
-        messages = []
-        if system_message:
-            messages.append({"role": "system", "content": system_message})
-        messages.append({"role": "user", "content": prompt})
+        # Only temperature 0 requests are deterministic enough to reuse
+        cache_key = (config, prompt, system_message) if config.temperature == 0.0 else None
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                return replace(cached, usage=dict(cached.usage), metadata=dict(cached.metadata))
         
-        # Prepare request parameters
-        request_params = {
-            "model": config.model,
-            "messages": messages,
-            "temperature": config.temperature,
-            "top_p": config.top_p,
-            "frequency_penalty": config.frequency_penalty,
-            "presence_penalty": config.presence_penalty,
-        }
+        messages = _build_messages(prompt, system_message)
         
-        if config.max_tokens:
-            request_params["max_tokens"] = config.max_tokens
-        
-        # Add any additional parameters
-        request_params.update(config.additional_params)
+        # Prepare request parameters; additional params take precedence
+        request_params = {"messages": messages, **self._base_request_params(config)}
         
         try:
             logger.debug(f"Making OpenAI request with model: {config.model}")
@@ -94,7 +176,7 @@ class OpenAIAdapter(LLMProviderInterface):
             choice = response.choices[0]
             content = choice.message.content or ""
             
-            return LLMResponse(
+            result = LLMResponse(
                 content=content,
                 usage={
                     "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
@@ -112,6 +194,14 @@ class OpenAIAdapter(LLMProviderInterface):
         except Exception as e:
             logger.error(f"OpenAI API error: {str(e)}")
             raise
+        
+        if cache_key is not None:
+            self._response_cache[cache_key] = replace(
+                result, usage=dict(result.usage), metadata=dict(result.metadata)
+            )
+            if len(self._response_cache) > _RESPONSE_CACHE_MAXSIZE:
+                self._response_cache.popitem(last=False)
+        return result
     
     async def generate_content_stream(
         self, 
@@ -125,27 +215,10 @@ class OpenAIAdapter(LLMProviderInterface):
         
         client = self._get_client(config)
         
-        # Build messages
-        messages = []
-        if system_message:
-            messages.append({"role": "system", "content": system_message})
-        messages.append({"role": "user", "content": prompt})
+        messages = _build_messages(prompt, system_message)
         
-        # Prepare request parameters
-        request_params = {
-            "model": config.model,
-            "messages": messages,
-            "temperature": config.temperature,
-            "top_p": config.top_p,
-            "frequency_penalty": config.frequency_penalty,
-            "presence_penalty": config.presence_penalty,
-            "stream": True
-        }
-        
-        if config.max_tokens:
-            request_params["max_tokens"] = config.max_tokens
-        
-        request_params.update(config.additional_params)
+        # Prepare request parameters; additional params take precedence
+        request_params = {"messages": messages, "stream": True, **self._base_request_params(config)}
         
         try:
             stream = await client.chat.completions.create(**request_params)
@@ -186,19 +259,7 @@ class OpenAIAdapter(LLMProviderInterface):
         
         client = self._get_client(config)
         
-        request_params = {
-            "model": config.model,
-            "messages": messages,
-            "temperature": config.temperature,
-            "top_p": config.top_p,
-            "frequency_penalty": config.frequency_penalty,
-            "presence_penalty": config.presence_penalty,
-        }
-        
-        if config.max_tokens:
-            request_params["max_tokens"] = config.max_tokens
-        
-        request_params.update(config.additional_params)
+        request_params = {"messages": messages, **self._base_request_params(config)}
         
         try:
             response = await client.chat.completions.create(**request_params)
@@ -227,11 +288,19 @@ class OpenAIAdapter(LLMProviderInterface):
             if config.provider != LLMProvider.OPENAI:
                 return False
             
-            if not config.api_key and not self.api_key:
+            api_key = config.api_key or self.api_key
+            if not api_key:
                 return False
             
-            # Test with a simple request
-            await self.generate_content("Test", config)
+            key = (api_key, config.base_url)
+            validated_at = self._validated.get(key)
+            if validated_at is not None and time.monotonic() - validated_at < _VALIDATION_CACHE_TTL_SECONDS:
+                return True
+            
+            # Listing models checks the key without a billed completion
+            client = self._get_client(config)
+            await asyncio.wait_for(client.models.list(), _VALIDATION_TIMEOUT_SECONDS)
+            self._validated[key] = time.monotonic()
             return True
             
         except Exception:
@@ -241,8 +310,15 @@ class OpenAIAdapter(LLMProviderInterface):
         """Get available OpenAI models."""
         try:
             client = self._get_client(config)
+            key = (config.api_key or self.api_key, config.base_url)
+            cached = self._models_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < _MODELS_CACHE_TTL_SECONDS:
+                return list(cached[1])
+            
             models = await client.models.list()
-            return [model.id for model in models.data if "gpt" in model.id.lower()]
+            model_ids = tuple(model.id for model in models.data if "gpt" in model.id.lower())
+            self._models_cache[key] = (time.monotonic(), model_ids)
+            return list(model_ids)
         except Exception:
             # Return default models if API call fails
             return config.get_available_models()
@@ -250,7 +326,7 @@ class OpenAIAdapter(LLMProviderInterface):
     async def estimate_tokens(self, text: str, model: str) -> int:
         """Estimate token count (simplified implementation)."""
         # This is a rough estimation - in production, use tiktoken
-        return len(text.split()) * 1.3  # Rough approximation
+        return int(len(text.split()) * 1.3)  # Rough approximation
     
     async def check_health(self, config: ProviderConfig) -> Dict[str, Any]:
         """Check OpenAI service health."""
@@ -2,13 +2,16 @@
 
 import logging
 import json
+import os
+import random
 import time
 from datetime import datetime
 from typing import Dict, Any, Optional, List
-from uuid import UUID, uuid4
 from dataclasses import dataclass, field
 from enum import Enum
 
+from ...domain._compat import DATACLASS_SLOTS
+
 
 class LogLevel(Enum):
     """Log levels for agent interactions."""
@@ -34,10 +37,46 @@ class InteractionType(Enum):
     DECISION_POINT = "decision_point"
 
 
-@dataclass
+# Log ids only need to be unique, not unpredictable: a PRNG seeded once from
+# os.urandom avoids a urandom syscall per id. Not suitable for anything secret.
+_id_rng = random.Random(os.urandom(32))
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=lambda: _id_rng.seed(os.urandom(32)))
+
+
+def _fast_id() -> str:
+    """Return a random 128-bit id as 32 hex characters."""
+    return "%032x" % _id_rng.getrandbits(128)
+
+
+_PY_LEVEL: Dict[LogLevel, int] = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+    LogLevel.CRITICAL: logging.CRITICAL
+}
+
+# Emoji prefix per interaction type for console output
+_INTERACTION_PREFIX: Dict[InteractionType, str] = {
+    InteractionType.AGENT_START: "🚀",
+    InteractionType.AGENT_END: "🏁",
+    InteractionType.AGENT_THINKING: "💭",
+    InteractionType.TOOL_CALL: "🛠️",
+    InteractionType.TOOL_RESPONSE: "✅",
+    InteractionType.TOOL_ERROR: "❌",
+    InteractionType.LLM_REQUEST: "🧠",
+    InteractionType.LLM_RESPONSE: "💬",
+    InteractionType.LLM_ERROR: "🚨",
+    InteractionType.CONTEXT_UPDATE: "📝",
+    InteractionType.DECISION_POINT: "🤔"
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class LogEntry:
     """Structured log entry for agent interactions."""
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=_fast_id)
     timestamp: datetime = field(default_factory=datetime.utcnow)
     interaction_type: InteractionType = InteractionType.AGENT_START
     level: LogLevel = LogLevel.INFO
@@ -100,7 +139,7 @@ class AgentLogger:
         task_description: str
     ) -> str:
         """Start a new agent execution session."""
-        session_id = str(uuid4())
+        session_id = _fast_id()
         
         self.active_sessions[session_id] = {
             'agent_id': agent_id,
@@ -114,6 +153,9 @@ class AgentLogger:
             'total_cost': 0.0
         }
         
+        if not self._should_log(LogLevel.INFO):
+            return session_id
+        
         entry = LogEntry(
             interaction_type=InteractionType.AGENT_START,
             level=LogLevel.INFO,
@@ -143,12 +185,16 @@ class AgentLogger:
         if session_id not in self.active_sessions:
             return
         
-        session = self.active_sessions[session_id]
+        session = self.active_sessions.pop(session_id)
+        level = LogLevel.INFO if success else LogLevel.ERROR
+        if not self._should_log(level):
+            return
+        
         duration = (time.time() - session['start_time']) * 1000
         
         entry = LogEntry(
             interaction_type=InteractionType.AGENT_END,
-            level=LogLevel.INFO if success else LogLevel.ERROR,
+            level=level,
             agent_id=session['agent_id'],
             agent_name=session['agent_name'],
             task_id=session['task_id'],
@@ -171,7 +217,6 @@ class AgentLogger:
         )
         
         self._log_entry(entry)
-        del self.active_sessions[session_id]
     
     def log_agent_thinking(
         self, 
@@ -181,6 +226,9 @@ class AgentLogger:
         next_action: str = ""
     ):
         """Log agent's thinking process."""
+        if not self._should_log(LogLevel.DEBUG):
+            return
+        
         session = self.active_sessions.get(session_id, {})
         
         entry = LogEntry(
@@ -209,12 +257,15 @@ class AgentLogger:
         tool_description: str = ""
     ) -> str:
         """Log a tool call start."""
-        call_id = str(uuid4())
+        call_id = _fast_id()
         session = self.active_sessions.get(session_id, {})
         
         if session_id in self.active_sessions:
             self.active_sessions[session_id]['tool_calls'] += 1
         
+        if not self._should_log(LogLevel.INFO):
+            return call_id
+        
         entry = LogEntry(
             interaction_type=InteractionType.TOOL_CALL,
             level=LogLevel.INFO,
@@ -246,11 +297,15 @@ class AgentLogger:
         success: bool = True
     ):
         """Log a tool call response."""
+        level = LogLevel.INFO if success else LogLevel.WARNING
+        if not self._should_log(level):
+            return
+        
         session = self.active_sessions.get(session_id, {})
         
         entry = LogEntry(
             interaction_type=InteractionType.TOOL_RESPONSE,
-            level=LogLevel.INFO if success else LogLevel.WARNING,
+            level=level,
             agent_id=session.get('agent_id'),
             agent_name=session.get('agent_name'),
             task_id=session.get('task_id'),
@@ -278,6 +333,9 @@ class AgentLogger:
         duration_ms: float
     ):
         """Log a tool call error."""
+        if not self._should_log(LogLevel.ERROR):
+            return
+        
         session = self.active_sessions.get(session_id, {})
         
         entry = LogEntry(
@@ -310,12 +368,15 @@ class AgentLogger:
         system_message: str = ""
     ) -> str:
         """Log an LLM request."""
-        request_id = str(uuid4())
+        request_id = _fast_id()
         session = self.active_sessions.get(session_id, {})
         
         if session_id in self.active_sessions:
             self.active_sessions[session_id]['llm_calls'] += 1
         
+        if not self._should_log(LogLevel.INFO):
+            return request_id
+        
         entry = LogEntry(
             interaction_type=InteractionType.LLM_REQUEST,
             level=LogLevel.INFO,
@@ -358,6 +419,9 @@ class AgentLogger:
             self.active_sessions[session_id]['total_tokens'] += tokens_used
             self.active_sessions[session_id]['total_cost'] += cost_usd
         
+        if not self._should_log(LogLevel.INFO):
+            return
+        
         entry = LogEntry(
             interaction_type=InteractionType.LLM_RESPONSE,
             level=LogLevel.INFO,
@@ -393,6 +457,9 @@ class AgentLogger:
         duration_ms: float
     ):
         """Log an LLM error."""
+        if not self._should_log(LogLevel.ERROR):
+            return
+        
         session = self.active_sessions.get(session_id, {})
         
         entry = LogEntry(
@@ -416,45 +483,23 @@ class AgentLogger:
         
         self._log_entry(entry)
     
+    def _should_log(self, level: LogLevel) -> bool:
+        """Check whether entries at this level would be emitted at all."""
+        return self.logger.isEnabledFor(_PY_LEVEL[level])
+    
     def _log_entry(self, entry: LogEntry):
         """Internal method to log an entry."""
         self.entries.append(entry)
         
         # Format message for console output
-        prefix = self._get_interaction_prefix(entry.interaction_type)
+        prefix = _INTERACTION_PREFIX.get(entry.interaction_type, "ℹ️")
         agent_info = f"[{entry.agent_name}]" if entry.agent_name else ""
         tool_info = f"[{entry.tool_name}]" if entry.tool_name else ""
         
         formatted_message = f"{prefix} {agent_info}{tool_info} {entry.message}"
         
         # Log to standard logger
-        if entry.level == LogLevel.DEBUG:
-            self.logger.debug(formatted_message)
-        elif entry.level == LogLevel.INFO:
-            self.logger.info(formatted_message)
-        elif entry.level == LogLevel.WARNING:
-            self.logger.warning(formatted_message)
-        elif entry.level == LogLevel.ERROR:
-            self.logger.error(formatted_message)
-        elif entry.level == LogLevel.CRITICAL:
-            self.logger.critical(formatted_message)
-    
-    def _get_interaction_prefix(self, interaction_type: InteractionType) -> str:
-        """Get emoji prefix for interaction type."""
-        prefixes = {
-            InteractionType.AGENT_START: "🚀",
-            InteractionType.AGENT_END: "🏁",
-            InteractionType.AGENT_THINKING: "💭",
-            InteractionType.TOOL_CALL: "🛠️",
-            InteractionType.TOOL_RESPONSE: "✅",
-            InteractionType.TOOL_ERROR: "❌",
-            InteractionType.LLM_REQUEST: "🧠",
-            InteractionType.LLM_RESPONSE: "💬",
-            InteractionType.LLM_ERROR: "🚨",
-            InteractionType.CONTEXT_UPDATE: "📝",
-            InteractionType.DECISION_POINT: "🤔"
-        }
-        return prefixes.get(interaction_type, "ℹ️")
+        self.logger.log(_PY_LEVEL[entry.level], formatted_message)
     
     def get_session_summary(self, session_id: str) -> Dict[str, Any]:
         """Get summary of a session."""
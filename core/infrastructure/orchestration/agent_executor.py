@@ -4,7 +4,7 @@ import logging
 import json
 import time
 import re
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional
 from uuid import UUID
 
 from ...domain.entities.agent import Agent, AgentRole
@@ -42,7 +42,7 @@ class AgentExecutor:
             'description': description
         }
     
-    def register_tools(self, tools: Dict[str, Dict[str, Any]]):
+    def register_tools(self, tools: Mapping[str, Dict[str, Any]]):
         """Register multiple tools at once."""
         for tool_name, tool_info in tools.items():
             self.register_tool(
@@ -252,7 +252,7 @@ class AgentExecutor:
         """Get the list of tools available to this agent."""
         available_tools = []
         
-        for tool_name in agent.tools:
+        for tool_name in sorted(agent.tools):
             if tool_name in self.tools_registry:
                 available_tools.append(tool_name)
         
@@ -262,7 +262,7 @@ class AgentExecutor:
         """Get descriptions of tools available to this agent."""
         tool_descriptions = []
         
-        for tool_name in agent.tools:
+        for tool_name in sorted(agent.tools):
             if tool_name in self.tools_registry:
                 description = self.tools_registry[tool_name]['description']
                 tool_descriptions.append(f"- {tool_name}: {description}")
@@ -1,15 +1,17 @@
 """Task orchestrator for workflow execution."""
 
+import asyncio
 import re
 import logging
+from collections import deque
 from typing import Dict, Any, List, Optional
-from uuid import UUID
 from datetime import datetime
 
 from ...domain.entities.workflow import Workflow, WorkflowStatus
 from ...domain.entities.task import Task, TaskStatus
 from ...domain.repositories.workflow_repository import WorkflowRepository
 from ..utils.template_utils import substitute_task_description
+from .workflow_persister import BackgroundWorkflowPersister
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,7 @@ class TaskOrchestrator:
     
     def __init__(self, workflow_repository: WorkflowRepository):
         self.workflow_repository = workflow_repository
+        self.persister = BackgroundWorkflowPersister(workflow_repository)
         self.task_outputs: Dict[str, str] = {}
         self.executed_tasks: set = set()
     
@@ -48,7 +51,7 @@ class TaskOrchestrator:
         
         # Update workflow status
         workflow.start()
-        await self.workflow_repository.update(workflow)
+        await self.persister.enqueue(workflow)
         
         try:
             # Initialize context
@@ -61,24 +64,23 @@ class TaskOrchestrator:
                 'context': workflow.context
             })
             
-            # Execute tasks in dependency order
-            for task in workflow.tasks:
-                await self._execute_task(task, execution_context, verbose)
+            # Execute tasks in dependency order: a task is queued as soon as
+            # its last dependency completes
+            await self._execute_task_layers(workflow, execution_context, verbose)
             
             # Mark workflow as completed
             from ...domain.entities.workflow import WorkflowResult
 
-            # Get final output (last task's output)
-            final_output = ""
-            if self.task_outputs:
-                final_output = list(self.task_outputs.values())[-1]
+            # Get final output (output of the last task in workflow order)
+            final_output = self._order_outputs_by_workflow(workflow)
 
             result = WorkflowResult(
                 final_output=final_output,
-                task_outputs={UUID(k): v for k, v in self.task_outputs.items()},
-                execution_time=(datetime.utcnow() - workflow.started_at).total_seconds() if workflow.started_at else 0
+                task_outputs=dict(self.task_outputs),
+                execution_time=workflow.get_execution_time() or 0
             )
             workflow.complete(result)
+            await self.persister.flush()
             await self.workflow_repository.update(workflow)
             
             logger.info(f"Workflow execution completed: {workflow.name}")
@@ -92,6 +94,7 @@ class TaskOrchestrator:
         except Exception as e:
             logger.error(f"Workflow execution failed: {str(e)}")
             workflow.fail(str(e))
+            await self.persister.flush()
             await self.workflow_repository.update(workflow)
             
             return {
@@ -100,6 +103,83 @@ class TaskOrchestrator:
                 'error': str(e),
                 'task_outputs': self.task_outputs
             }
+        
+        finally:
+            # Stop the background writer so it does not outlive this run
+            await self.persister.close()
+    
+    async def _execute_task_layers(
+        self,
+        workflow: Workflow,
+        context: Dict[str, Any],
+        verbose: bool = True
+    ) -> None:
+        """
+        Execute workflow tasks layer by layer.
+        
+        All tasks whose dependencies are satisfied run concurrently, so
+        independent branches overlap their LLM latency. Tasks left over
+        (e.g. a dependency cycle in a stored workflow) run sequentially.
+        
+        Args:
+            workflow: The workflow whose tasks to execute
+            context: Execution context
+            verbose: Whether to log execution details
+        """
+        workflow.index_dependencies()
+        ready = deque(task for task in workflow.tasks if task.remaining_deps == 0)
+        
+        executed = set()
+        while ready:
+            layer = list(ready)
+            ready.clear()
+            
+            if len(layer) == 1:
+                await self._execute_task(layer[0], context, verbose)
+            else:
+                results = await asyncio.gather(
+                    *(self._execute_task(task, context, verbose) for task in layer),
+                    return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+            
+            # Persist progress in the background while the next layer runs
+            await self.persister.enqueue(workflow)
+            
+            for task in layer:
+                executed.add(task.id)
+                ready.extend(workflow.notify_task_completed(task.id))
+        
+        pending = [task for task in workflow.tasks if task.id not in executed]
+        if pending:
+            logger.warning(
+                "Unresolvable dependencies in workflow %s, running %d tasks sequentially",
+                workflow.name, len(pending)
+            )
+            for task in pending:
+                await self._execute_task(task, context, verbose)
+    
+    def _order_outputs_by_workflow(self, workflow: Workflow) -> str:
+        """
+        Reorder this workflow's task outputs to follow ``workflow.tasks``.
+        
+        Tasks in a layer finish in any order, so outputs are moved into
+        declaration order once the workflow is done.
+        
+        Args:
+            workflow: The executed workflow
+            
+        Returns:
+            Output of the last task in the workflow, or "" if none ran
+        """
+        final_output = ""
+        for task in workflow.tasks:
+            task_id = str(task.id)
+            if task_id in self.task_outputs:
+                final_output = self.task_outputs[task_id] = self.task_outputs.pop(task_id)
+        return final_output
     
     async def _execute_task(
         self, 
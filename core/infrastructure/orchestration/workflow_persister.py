@@ -0,0 +1,95 @@
+"""Background persistence of workflow state."""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+from uuid import UUID
+
+from ...domain.entities.workflow import Workflow
+from ...domain.repositories.workflow_repository import WorkflowRepository
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundWorkflowPersister:
+    """
+    Persists workflow updates from a background worker task.
+    
+    Intermediate state changes (workflow started, task completed) are queued
+    instead of awaited, so serialization and repository I/O stay off the
+    execution path. Updates are coalesced per workflow: while a workflow is
+    waiting to be written, enqueuing it again adds nothing, and the worker
+    writes its state as of the moment it is picked up. The bounded queue
+    applies backpressure if the repository falls behind; flush() waits until
+    everything queued has been written and close() stops the worker.
+    """
+    
+    def __init__(self, workflow_repository: WorkflowRepository, maxsize: int = 1024):
+        self.workflow_repository = workflow_repository
+        self.maxsize = maxsize
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Workflows waiting to be written, keyed by id in queue order
+        self._pending: Dict[UUID, Workflow] = {}
+    
+    async def enqueue(self, workflow: Workflow) -> None:
+        """Queue a workflow update, waiting only if the queue is full."""
+        queue = self._ensure_worker()
+        if workflow.id in self._pending:
+            self._pending[workflow.id] = workflow
+            return
+        self._pending[workflow.id] = workflow
+        await queue.put(workflow.id)
+    
+    async def flush(self) -> None:
+        """Wait until all queued updates have been written."""
+        if self._pending:
+            # Restarts the worker if the updates were queued on another loop
+            self._ensure_worker()
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+    
+    async def close(self) -> None:
+        """Write any queued updates, then cancel and await the worker."""
+        await self.flush()
+        worker = self._worker
+        if worker is not None and self._loop is asyncio.get_running_loop():
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+        self._worker = None
+        self._queue = None
+        self._loop = None
+    
+    def _ensure_worker(self) -> asyncio.Queue:
+        """Start the worker on the running loop if it is not already running there."""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            # Updates left by a worker on a previous loop move to the new one
+            for workflow_id in self._pending:
+                self._queue.put_nowait(workflow_id)
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+    
+    async def _run(self, queue: asyncio.Queue) -> None:
+        """Write queued workflows until cancelled."""
+        while True:
+            workflow_id = await queue.get()
+            # Taken off the pending map before writing, so a change made
+            # during the write queues the workflow again
+            workflow = self._pending.pop(workflow_id, None)
+            try:
+                if workflow is not None:
+                    await self.workflow_repository.update(workflow)
+            except asyncio.CancelledError:
+                # Interrupted mid-write (e.g. its loop shut down): keep the
+                # update so the next worker writes it
+                if workflow is not None:
+                    self._pending.setdefault(workflow_id, workflow)
+                raise
+            except Exception as e:
+                logger.warning(f"Background update of workflow {workflow_id} failed: {str(e)}")
+            finally:
+                queue.task_done()
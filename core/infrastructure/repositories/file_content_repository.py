@@ -1,12 +1,13 @@
 """File-based content repository implementation."""
 
-import json
 import logging
 from typing import List, Optional
 from uuid import UUID
 from pathlib import Path
 from datetime import datetime
 
+import orjson
+
 from ...domain.entities.content import Content, ContentType, ContentStatus
 from ...domain.repositories.content_repository import ContentRepository
 
@@ -47,11 +48,11 @@ class FileContentRepository(ContentRepository):
             
             # Save metadata
             metadata_file = self._get_metadata_file_path(content.id)
-            metadata = content.to_dict()
-            metadata.pop('body', None)  # Don't duplicate body in metadata
+            # Don't duplicate body in metadata
+            metadata = content.to_json_bytes(include_body=False, indent=True)
             
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            with open(metadata_file, 'wb') as f:
+                f.write(metadata)
             
             logger.info(f"Saved content {content.id} to {content_file}")
             return content
@@ -70,8 +71,8 @@ class FileContentRepository(ContentRepository):
                 return None
             
             # Load metadata
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
+            with open(metadata_file, 'rb') as f:
+                metadata = orjson.loads(f.read())
             
             # Load content body
             with open(content_file, 'r', encoding='utf-8') as f:
@@ -1,8 +1,8 @@
 """File-based workflow repository implementation."""
 
-import json
 import logging
-from typing import List, Optional
+from itertools import chain, islice
+from typing import Iterator, List, Optional
 from uuid import UUID, uuid4
 from pathlib import Path
 
@@ -38,11 +38,10 @@ class FileWorkflowRepository(WorkflowRepository):
             is_template = workflow.status == WorkflowStatus.DRAFT
             file_path = self._get_workflow_file_path(workflow.id, is_template)
             
-            # Convert workflow to dict
-            data = workflow.to_dict()
+            data = workflow.to_json_bytes(indent=True)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(file_path, 'wb') as f:
+                f.write(data)
             
             logger.info(f"Saved workflow {workflow.id} to {file_path}")
             return workflow
@@ -58,9 +57,7 @@ class FileWorkflowRepository(WorkflowRepository):
             file_path = self._get_workflow_file_path(workflow_id, is_template)
             if file_path.exists():
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    return Workflow.from_dict(data)
+                    return Workflow.from_json_bytes(file_path.read_bytes())
                 except Exception as e:
                     logger.error(f"Failed to load workflow {workflow_id}: {str(e)}")
         
@@ -84,41 +81,38 @@ class FileWorkflowRepository(WorkflowRepository):
         all_workflows = await self.get_all()
         return [w for w in all_workflows if w.status == status]
     
-    async def get_all(self) -> List[Workflow]:
-        """Get all workflows."""
+    def _iter_workflow_files(self) -> Iterator[Path]:
+        """Iterate workflow files from both templates and instances."""
+        dirs = (self.base_path / subdir for subdir in ["templates", "instances"])
+        return chain.from_iterable(d.glob("*.json") for d in dirs if d.exists())
+    
+    def _load_workflows(self, workflow_files: Iterator[Path]) -> List[Workflow]:
+        """Load workflows from files, skipping unreadable ones."""
         workflows = []
-        
-        # Load from both templates and instances
-        for subdir in ["templates", "instances"]:
-            workflow_dir = self.base_path / subdir
-            if workflow_dir.exists():
-                for workflow_file in workflow_dir.glob("*.json"):
-                    try:
-                        with open(workflow_file, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        workflow = Workflow.from_dict(data)
-                        workflows.append(workflow)
-                    except Exception as e:
-                        logger.warning(f"Failed to load workflow from {workflow_file}: {str(e)}")
+        for workflow_file in workflow_files:
+            try:
+                workflows.append(Workflow.from_json_bytes(workflow_file.read_bytes()))
+            except Exception as e:
+                logger.warning(f"Failed to load workflow from {workflow_file}: {str(e)}")
         
         return workflows
     
+    async def get_all(self) -> List[Workflow]:
+        """Get all workflows."""
+        return self._load_workflows(self._iter_workflow_files())
+    
+    async def get_paginated(self, limit: int, offset: int = 0) -> List[Workflow]:
+        """Get a page of workflows, only reading the files in the page."""
+        page_files = islice(self._iter_workflow_files(), offset, offset + limit)
+        return self._load_workflows(page_files)
+    
     async def get_templates(self) -> List[Workflow]:
         """Get workflow templates."""
-        templates = []
         templates_dir = self.base_path / "templates"
+        if not templates_dir.exists():
+            return []
         
-        if templates_dir.exists():
-            for template_file in templates_dir.glob("*.json"):
-                try:
-                    with open(template_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    workflow = Workflow.from_dict(data)
-                    templates.append(workflow)
-                except Exception as e:
-                    logger.warning(f"Failed to load template from {template_file}: {str(e)}")
-        
-        return templates
+        return self._load_workflows(templates_dir.glob("*.json"))
     
     async def update(self, workflow: Workflow) -> Workflow:
         """Update an existing workflow."""
@@ -66,7 +66,7 @@ class YamlAgentRepository(AgentRepository):
                 'goal': agent.goal,
                 'backstory': agent.backstory,
                 'system_message': agent.system_message,
-                'tools': agent.tools,
+                'tools': sorted(agent.tools),
                 'examples': agent.examples,
                 'metadata': agent.metadata,
                 'is_active': agent.is_active
@@ -102,6 +102,11 @@ class YamlAgentRepository(AgentRepository):
                 return agent
         return None
     
+    async def get_many(self, agent_ids: List[UUID]) -> List[Optional[Agent]]:
+        """Get several agents by ID with a single scan of the profiles."""
+        agents_by_id = {agent.id: agent for agent in await self.get_all()}
+        return [agents_by_id.get(agent_id) for agent_id in agent_ids]
+    
     async def get_by_name(self, name: str) -> Optional[Agent]:
         """Get an agent by name."""
         # Search through all client profiles
@@ -0,0 +1,54 @@
+"""
+Asyncio runtime utilities.
+"""
+
+import asyncio
+import logging
+from typing import Any, Coroutine, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def install_eager_task_factory(loop: Optional[asyncio.AbstractEventLoop] = None) -> bool:
+    """
+    Install asyncio's eager task factory on the event loop.
+    
+    With the eager factory, coroutines wrapped in tasks start executing
+    immediately and, when they complete without suspending (in-memory
+    repositories, cache hits), never round-trip through the event loop.
+    
+    Args:
+        loop: Event loop to configure (defaults to the running loop)
+        
+    Returns:
+        True if the factory was installed, False if unsupported (Python < 3.12)
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        return False
+    
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    
+    loop.set_task_factory(eager_task_factory)
+    logger.debug("Eager task factory installed")
+    return True
+
+
+def run_with_eager_tasks(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine like asyncio.run, with the eager task factory installed.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    async def _main() -> T:
+        install_eager_task_factory()
+        return await coro
+    
+    return asyncio.run(_main())
@@ -0,0 +1,46 @@
+"""Unit tests for the asyncio runtime utilities."""
+
+import asyncio
+import sys
+
+import pytest
+
+from core.infrastructure.utils.async_utils import install_eager_task_factory, run_with_eager_tasks
+
+
+class TestEagerTasks:
+    """Test running coroutines with the eager task factory."""
+
+    def test_returns_coroutine_result(self):
+        """Test the coroutine's result is returned on every Python version."""
+        async def answer():
+            return 42
+
+        assert run_with_eager_tasks(answer()) == 42
+
+    @pytest.mark.skipif(sys.version_info >= (3, 12), reason="eager tasks are available")
+    def test_factory_unsupported_before_3_12(self):
+        """Test installing the factory reports it is unsupported."""
+        async def main():
+            return install_eager_task_factory()
+
+        assert asyncio.run(main()) is False
+
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="eager tasks need Python 3.12")
+    def test_task_runs_synchronously_until_first_await(self):
+        """Test a new task's body runs inside create_task, before the caller resumes."""
+        events = []
+
+        async def child():
+            events.append("child started")
+            await asyncio.sleep(0)
+            events.append("child resumed")
+
+        async def main():
+            task = asyncio.create_task(child())
+            events.append("task created")
+            await task
+
+        run_with_eager_tasks(main())
+
+        assert events == ["child started", "task created", "child resumed"]
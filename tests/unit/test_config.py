@@ -0,0 +1,72 @@
+"""Unit tests for the configuration settings."""
+
+import pytest
+
+from core.infrastructure.config import ProviderSettings, Settings
+
+
+_PROVIDER_KEY_CASES = [
+    {"openai_api_key": None, "anthropic_api_key": None, "deepseek_api_key": None},
+    {"openai_api_key": "sk-openai", "anthropic_api_key": None, "deepseek_api_key": None},
+    {"openai_api_key": "", "anthropic_api_key": "sk-anthropic", "deepseek_api_key": "sk-deepseek"},
+]
+
+
+def _expected_providers(keys):
+    """Availability map the provider API key fields describe."""
+    return {
+        "openai": bool(keys["openai_api_key"]),
+        "anthropic": bool(keys["anthropic_api_key"]),
+        "deepseek": bool(keys["deepseek_api_key"]),
+    }
+
+
+class TestProviderSettings:
+    """Test provider availability on ProviderSettings."""
+
+    @pytest.mark.parametrize("keys", _PROVIDER_KEY_CASES)
+    def test_availability_matches_api_keys(self, keys):
+        """Test the precomputed availability matches the API key fields."""
+        settings = ProviderSettings(**keys)
+
+        assert dict(settings.get_available_providers()) == _expected_providers(keys)
+        assert settings.has_any_provider() == any(keys.values())
+
+    def test_available_providers_are_read_only(self):
+        """Test callers cannot change the shared availability map."""
+        providers = ProviderSettings(openai_api_key="sk-openai").get_available_providers()
+
+        with pytest.raises(TypeError):
+            providers["openai"] = False
+
+
+class TestSettings:
+    """Test provider lookups on Settings."""
+
+    @pytest.fixture(autouse=True)
+    def _isolate(self, tmp_path, monkeypatch):
+        # Settings creates its data directories relative to the working directory
+        monkeypatch.chdir(tmp_path)
+        for name in ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "DEEPSEEK_API_KEY"):
+            monkeypatch.delenv(name, raising=False)
+
+    @pytest.mark.parametrize("keys", _PROVIDER_KEY_CASES)
+    def test_availability_matches_api_keys(self, keys):
+        """Test the precomputed provider lookups match the API key fields."""
+        settings = Settings(_env_file=None, **keys)
+
+        assert dict(settings.get_available_providers()) == _expected_providers(keys)
+        assert settings.has_any_provider() == any(keys.values())
+        assert settings.get_provider_api_key("OpenAI") == keys["openai_api_key"]
+        assert settings.get_provider_api_key("deepseek") == keys["deepseek_api_key"]
+
+    def test_availability_reads_environment(self, monkeypatch):
+        """Test API keys taken from the environment are reflected."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-anthropic")
+
+        settings = Settings(_env_file=None)
+
+        assert settings.get_available_providers() == {
+            "openai": False, "anthropic": True, "deepseek": False
+        }
+        assert settings.has_any_provider()
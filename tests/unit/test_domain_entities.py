@@ -1,5 +1,8 @@
 """Unit tests for domain entities."""
 
+import subprocess
+import sys
+
 import pytest
 from uuid import uuid4
 from datetime import datetime
@@ -8,6 +11,8 @@ from core.domain.entities.agent import Agent, AgentRole
 from core.domain.entities.content import Content, ContentType, ContentFormat, ContentStatus
 from core.domain.entities.task import Task, TaskStatus, TaskPriority, TaskResult
 from core.domain.entities.workflow import Workflow, WorkflowType, WorkflowStatus
+from core.domain.value_objects.client_profile import ClientProfile
+from core.domain.value_objects import provider_config
 from core.domain.value_objects.provider_config import ProviderConfig, LLMProvider
 
 
@@ -94,6 +99,17 @@ class TestContent:
         assert content.metrics.character_count > 0
         assert content.metrics.reading_time_minutes > 0
     
+    def test_content_from_dict_keeps_persisted_metrics(self):
+        """Test that deserialized content reuses stored metrics."""
+        data = Content(title="Test", body="one two three").to_dict()
+        data["metrics"]["word_count"] = 42
+        
+        content = Content.from_dict(data)
+        assert content.metrics.word_count == 42
+        
+        content.update_content(body="one two")
+        assert content.metrics.word_count == 2
+    
     def test_content_status_transitions(self):
         """Test valid status transitions."""
         content = Content(title="Test", body="Test content")
@@ -182,6 +198,20 @@ class TestTask:
         assert not task2.can_start([])  # task1 not completed
         assert task2.can_start([task1.id])  # task1 completed
     
+    def test_task_dependency_counter(self):
+        """Test remaining dependency counter."""
+        task1 = Task(name="task1", description="First task")
+        task2 = Task(name="task2", description="Second task")
+        task3 = Task(name="task3", description="Third task")
+        
+        task3.add_dependency(task1.id)
+        task3.add_dependency(task2.id)
+        assert task3.remaining_deps == 2
+        
+        assert not task3.on_dependency_completed()
+        assert task3.on_dependency_completed()
+        assert task3.remaining_deps == 0
+    
     def test_task_execution_flow(self):
         """Test task execution flow."""
         task = Task(name="test", description="Test task")
@@ -198,6 +228,20 @@ class TestTask:
         assert task.completed_at is not None
         assert task.result.output == "Task completed successfully"
     
+    def test_task_execution_time(self):
+        """Test execution time is reported while running and frozen once done."""
+        task = Task(name="test", description="Test task")
+        assert task.get_execution_time() is None
+        
+        task.start()
+        running = task.get_execution_time()
+        assert running is not None and running >= 0
+        
+        task.complete(TaskResult(output="Done"))
+        finished = task.get_execution_time()
+        assert finished >= running
+        assert task.get_execution_time() == finished
+    
     def test_task_failure(self):
         """Test task failure."""
         task = Task(name="test", description="Test task")
@@ -267,6 +311,25 @@ class TestWorkflow:
         assert len(ready_tasks) == 1
         assert ready_tasks[0] == task1  # Only task1 has no dependencies
     
+    def test_workflow_dependency_index(self):
+        """Test reverse dependency index built on mark_ready."""
+        workflow = Workflow(name="test", workflow_type=WorkflowType.BASIC)
+        
+        task1 = Task(name="task1", description="First task")
+        task2 = Task(name="task2", description="Second task")
+        task2.add_dependency(task1.id)
+        task2.add_dependency(uuid4())  # Unknown task, not counted
+        
+        workflow.add_task(task1)
+        workflow.add_task(task2)
+        workflow.mark_ready()
+        
+        assert workflow.get_dependents(task1.id) == [task2]
+        assert workflow.get_dependents(task2.id) == []
+        assert task2.remaining_deps == 1
+        assert workflow.notify_task_completed(task1.id) == [task2]
+        assert task2.remaining_deps == 0
+    
     def test_workflow_validation(self):
         """Test workflow validation."""
         workflow = Workflow(name="test", workflow_type=WorkflowType.BASIC)
@@ -299,6 +362,24 @@ class TestWorkflow:
         errors = workflow.validate()
         assert any("circular" in error.lower() for error in errors)
     
+    def test_workflow_deep_dependency_chain(self):
+        """Test cycle detection on chains deeper than the recursion limit."""
+        workflow = Workflow(name="test", workflow_type=WorkflowType.BASIC)
+        
+        previous = None
+        for i in range(sys.getrecursionlimit() + 100):
+            task = Task(name=f"task{i}", description="Chained task")
+            if previous:
+                task.add_dependency(previous.id)
+            workflow.add_task(task)
+            previous = task
+        
+        assert workflow.validate() == []
+        
+        # Close the loop back to the first task
+        workflow.tasks[0].add_dependency(previous.id)
+        assert any("circular" in error.lower() for error in workflow.validate())
+    
     def test_workflow_progress(self):
         """Test workflow progress calculation."""
         workflow = Workflow(name="test", workflow_type=WorkflowType.BASIC)
@@ -323,3 +404,80 @@ class TestWorkflow:
         
         assert workflow.get_progress() == 1.0
         assert workflow.is_completed()
+
+
+class TestClientProfile:
+    """Test ClientProfile value object."""
+    
+    def test_shared_profile_is_read_only(self):
+        """Test the shared Siebert profile cannot be altered through its getters."""
+        profile = ClientProfile.create_siebert_profile()
+        
+        preferences = profile.get_content_preferences()
+        preferences["tone"] = "changed"
+        with pytest.raises(TypeError):
+            profile.terminology["portfolio"] = "changed"
+        
+        fresh = ClientProfile.create_siebert_profile()
+        assert fresh.get_content_preferences()["tone"] == "educational and empowering"
+        assert fresh.get_content_preferences("newsletter")["length"] == "600-800 words"
+    
+    def test_profile_round_trip(self):
+        """Test to_dict returns plain dicts that rebuild an equal profile."""
+        profile = ClientProfile.create_siebert_profile()
+        data = profile.to_dict()
+        
+        assert type(data["terminology"]) is dict
+        assert ClientProfile.from_dict(data) == profile
+
+
+class TestProviderConfig:
+    """Test ProviderConfig value object."""
+    
+    def test_config_is_frozen_with_optimizations(self):
+        """Test configs stay immutable when Python runs with -O."""
+        script = (
+            "import dataclasses\n"
+            "from core.domain.value_objects.provider_config import ProviderConfig\n"
+            "try:\n"
+            "    ProviderConfig().temperature = 1.0\n"
+            "except dataclasses.FrozenInstanceError:\n"
+            "    print('frozen')\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-O", "-c", script], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "frozen"
+    
+    def test_additional_params_are_read_only(self):
+        """Test additional_params is a snapshot that cannot be changed later."""
+        params = {"seed": 1}
+        config = ProviderConfig(additional_params=params)
+        params["seed"] = 2
+        
+        assert config.additional_params["seed"] == 1
+        with pytest.raises(TypeError):
+            config.additional_params["seed"] = 3
+        assert config.to_dict()["additional_params"] == {"seed": 1}
+    
+    def test_invalid_ranges_rejected(self):
+        """Test out-of-range parameters are rejected on construction."""
+        with pytest.raises(ValueError):
+            ProviderConfig(temperature=3.0)
+        with pytest.raises(ValueError):
+            ProviderConfig().with_temperature(-1.0)
+
+    def test_zero_hash_is_cached(self, monkeypatch):
+        """Test a field hash of 0 is computed once like any other value."""
+        calls = []
+
+        def zero_hash(value):
+            calls.append(value)
+            return 0
+
+        monkeypatch.setattr(provider_config, "hash", zero_hash, raising=False)
+        config = ProviderConfig()
+
+        assert hash(config) == 0
+        assert hash(config) == 0
+        assert len(calls) == 1
@@ -0,0 +1,222 @@
+"""Unit tests for the external service adapters."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from core.domain.value_objects.provider_config import LLMProvider, ProviderConfig
+from core.infrastructure.external_services import _http, openai_adapter
+from core.infrastructure.external_services._http import (
+    aclose_shared_http_client,
+    get_shared_http_client,
+)
+from core.infrastructure.external_services.openai_adapter import OpenAIAdapter
+
+
+class _StubOpenAIClient:
+    """Stand-in for AsyncOpenAI that counts API calls."""
+
+    def __init__(self):
+        self.completion_calls = 0
+        self.model_calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self.models = SimpleNamespace(list=self._list_models)
+
+    async def _create(self, messages, **params):
+        self.completion_calls += 1
+        return SimpleNamespace(
+            id=f"resp-{self.completion_calls}",
+            created=0,
+            model=params["model"],
+            usage=SimpleNamespace(prompt_tokens=1, completion_tokens=2, total_tokens=3),
+            choices=[SimpleNamespace(
+                message=SimpleNamespace(content=f"answer to {messages[-1]['content']}"),
+                finish_reason="stop"
+            )]
+        )
+
+    async def _list_models(self):
+        self.model_calls += 1
+        return SimpleNamespace(data=[
+            SimpleNamespace(id="gpt-4o"),
+            SimpleNamespace(id="whisper-1"),
+        ])
+
+
+def _openai_config(**overrides):
+    """Build an OpenAI provider config with a test key."""
+    return ProviderConfig(
+        provider=LLMProvider.OPENAI,
+        model="gpt-4o",
+        api_key="sk-test",
+        **overrides
+    )
+
+
+class TestSharedHttpClient:
+    """Test the process-wide HTTP client."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_client(self):
+        yield
+        _http._shared_client = None
+        _http._shared_loop = None
+
+    def test_new_event_loop_gets_new_client(self):
+        """Test each event loop gets its own client and pool."""
+        async def get_client():
+            first = get_shared_http_client()
+            assert get_shared_http_client() is first
+            return first
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        assert second is not first
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_client(self):
+        """Test closing releases the client and the next call opens a new one."""
+        client = get_shared_http_client()
+        await aclose_shared_http_client()
+
+        assert client.is_closed
+        assert get_shared_http_client() is not client
+        await aclose_shared_http_client()
+
+
+class TestOpenAIAdapterCaches:
+    """Test the client, response and model list caches of the OpenAI adapter."""
+
+    @pytest.fixture
+    def stub_client(self, monkeypatch):
+        client = _StubOpenAIClient()
+        monkeypatch.setattr(OpenAIAdapter, "_get_client", lambda self, config: client)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_deterministic_response_is_cached(self, stub_client):
+        """Test a repeated temperature 0 request is answered from the cache."""
+        adapter = OpenAIAdapter()
+        config = _openai_config(temperature=0.0)
+
+        first = await adapter.generate_content_detailed("hello", config)
+        second = await adapter.generate_content_detailed("hello", config)
+
+        assert stub_client.completion_calls == 1
+        assert second == first
+        assert second is not first
+
+    @pytest.mark.asyncio
+    async def test_cached_response_is_a_copy(self, stub_client):
+        """Test changing a returned response does not alter the cached one."""
+        adapter = OpenAIAdapter()
+        config = _openai_config(temperature=0.0)
+
+        first = await adapter.generate_content_detailed("hello", config)
+        first.usage["total_tokens"] = 0
+        first.metadata["response_id"] = "changed"
+        second = await adapter.generate_content_detailed("hello", config)
+
+        assert second.usage["total_tokens"] == 3
+        assert second.metadata["response_id"] == "resp-1"
+
+    @pytest.mark.asyncio
+    async def test_sampled_response_is_not_cached(self, stub_client):
+        """Test requests with a non-zero temperature always reach the API."""
+        adapter = OpenAIAdapter()
+        config = _openai_config(temperature=0.7)
+
+        await adapter.generate_content_detailed("hello", config)
+        await adapter.generate_content_detailed("hello", config)
+
+        assert stub_client.completion_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_response_cache_evicts_least_recently_used(self, stub_client):
+        """Test the response cache holds at most its maximum size."""
+        adapter = OpenAIAdapter()
+        config = _openai_config(temperature=0.0)
+        maxsize = openai_adapter._RESPONSE_CACHE_MAXSIZE
+
+        for i in range(maxsize + 1):
+            await adapter.generate_content_detailed(f"prompt {i}", config)
+        assert stub_client.completion_calls == maxsize + 1
+
+        # The newest entry is still cached, the oldest was evicted
+        await adapter.generate_content_detailed(f"prompt {maxsize}", config)
+        assert stub_client.completion_calls == maxsize + 1
+        await adapter.generate_content_detailed("prompt 0", config)
+        assert stub_client.completion_calls == maxsize + 2
+
+    def test_request_params_are_cached_per_adapter(self):
+        """Test request params are built once per config and kept by the adapter."""
+        adapter = OpenAIAdapter()
+        config = _openai_config(additional_params={"seed": 7})
+
+        params = adapter._base_request_params(config)
+
+        assert params["seed"] == 7
+        assert adapter._base_request_params(_openai_config(additional_params={"seed": 7})) is params
+        assert OpenAIAdapter()._base_request_params(config) is not params
+
+    @pytest.mark.asyncio
+    async def test_validation_is_cached_until_ttl(self, stub_client, monkeypatch):
+        """Test a passed validation is reused, then re-checked once it expires."""
+        adapter = OpenAIAdapter()
+        config = _openai_config()
+
+        assert await adapter.validate_config(config)
+        assert await adapter.validate_config(config)
+        assert stub_client.model_calls == 1
+
+        monkeypatch.setattr(openai_adapter, "_VALIDATION_CACHE_TTL_SECONDS", 0.0)
+        assert await adapter.validate_config(config)
+        assert stub_client.model_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_model_list_is_cached(self, stub_client):
+        """Test the model list is fetched once within the TTL."""
+        adapter = OpenAIAdapter()
+        config = _openai_config()
+
+        first = await adapter.get_available_models(config)
+        first.append("mutated")
+        second = await adapter.get_available_models(config)
+
+        assert second == ["gpt-4o"]
+        assert stub_client.model_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_model_list_expires(self, stub_client, monkeypatch):
+        """Test the model list is fetched again once the TTL has passed."""
+        monkeypatch.setattr(openai_adapter, "_MODELS_CACHE_TTL_SECONDS", 0.0)
+        adapter = OpenAIAdapter()
+        config = _openai_config()
+
+        await adapter.get_available_models(config)
+        await adapter.get_available_models(config)
+
+        assert stub_client.model_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_client_cache_reuses_and_evicts_clients(self):
+        """Test clients are kept per API key up to the cache size."""
+        adapter = OpenAIAdapter()
+        maxsize = openai_adapter._CLIENT_CACHE_MAXSIZE
+        try:
+            first = adapter._get_client(_openai_config())
+            assert adapter._get_client(_openai_config()) is first
+
+            for i in range(maxsize):
+                adapter._get_client(ProviderConfig(api_key=f"sk-other-{i}"))
+            assert len(adapter._clients) == maxsize
+            current = adapter._get_client(_openai_config())
+            assert current is not first
+
+            # Clients built on a closed shared HTTP client are rebuilt
+            await aclose_shared_http_client()
+            assert adapter._get_client(_openai_config()) is not current
+        finally:
+            await aclose_shared_http_client()
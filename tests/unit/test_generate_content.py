@@ -0,0 +1,79 @@
+"""Unit tests for the generate content use case."""
+
+import pytest
+
+from core.application.dto.content_request import ContentGenerationRequest
+from core.application.use_cases import generate_content
+from core.application.use_cases.generate_content import GenerateContentUseCase
+
+
+class _StubContentRepository:
+    """Content repository that keeps saved content in memory."""
+
+    def __init__(self):
+        self.saved = []
+
+    async def save(self, content):
+        self.saved.append(content)
+        return content
+
+
+def _build_use_case(provider_config, runs):
+    """Build a use case whose workflow step only records that it ran."""
+    use_case = GenerateContentUseCase(
+        content_repository=_StubContentRepository(),
+        workflow_repository=None,
+        agent_repository=None,
+        llm_provider=None,
+        provider_config=provider_config
+    )
+
+    async def build_context(request):
+        return {"topic": request.topic}
+
+    async def execute_workflow(workflow_type, context):
+        runs.append(workflow_type)
+        return {"final_output": f"# {context['topic']}\n\nBody text.", "workflow_id": "wf"}
+
+    use_case._build_dynamic_context = build_context
+    use_case._execute_dynamic_workflow = execute_workflow
+    return use_case
+
+
+class TestGenerateContentResultCache:
+    """Test the process-wide generation result cache."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        generate_content.clear_result_cache()
+        yield
+        generate_content.clear_result_cache()
+
+    @pytest.mark.asyncio
+    async def test_identical_request_hits_cache_across_instances(self, sample_provider_config):
+        """Test a second identical request is served from cache by a new use case."""
+        runs = []
+        first = await _build_use_case(sample_provider_config, runs).execute(
+            ContentGenerationRequest(topic="Caching")
+        )
+        second = await _build_use_case(sample_provider_config, runs).execute(
+            ContentGenerationRequest(topic="Caching")
+        )
+
+        assert first.success and second.success
+        assert runs == ["enhanced_article"]
+        assert "cache_hit" not in first.metadata
+        assert second.metadata["cache_hit"] is True
+        assert second.content_id == first.content_id
+        assert second.body == first.body
+
+    @pytest.mark.asyncio
+    async def test_bypass_cache_skips_cache(self, sample_provider_config):
+        """Test bypass_cache runs the workflow even when a result is cached."""
+        runs = []
+        use_case = _build_use_case(sample_provider_config, runs)
+        await use_case.execute(ContentGenerationRequest(topic="Caching"))
+        response = await use_case.execute(ContentGenerationRequest(topic="Caching", bypass_cache=True))
+
+        assert runs == ["enhanced_article", "enhanced_article"]
+        assert "cache_hit" not in response.metadata
@@ -0,0 +1,85 @@
+"""Unit tests for the task orchestrator."""
+
+import asyncio
+
+import pytest
+
+from core.domain.entities.task import Task, TaskStatus
+from core.domain.entities.workflow import Workflow, WorkflowType, WorkflowStatus
+from core.infrastructure.orchestration.task_orchestrator import TaskOrchestrator
+
+
+class _StubWorkflowRepository:
+    """Workflow repository that records updates."""
+
+    def __init__(self):
+        self.updates = []
+
+    async def update(self, workflow):
+        self.updates.append(workflow.status)
+        return workflow
+
+
+class _TimedOrchestrator(TaskOrchestrator):
+    """Orchestrator whose tasks sleep for a per-task delay."""
+
+    def __init__(self, workflow_repository, delays):
+        super().__init__(workflow_repository)
+        self.delays = delays
+        self.started = []
+
+    async def _execute_task_logic(self, task, description, context):
+        self.started.append(task.name)
+        await asyncio.sleep(self.delays.get(task.name, 0))
+        return f"output of {task.name}"
+
+
+def _build_workflow(*edges, names):
+    """Build a workflow from task names and (task, dependency) edges."""
+    workflow = Workflow(name="graph", workflow_type=WorkflowType.BASIC)
+    tasks = {name: Task(name=name, description=name) for name in names}
+    for task_name, dep_name in edges:
+        tasks[task_name].add_dependency(tasks[dep_name].id)
+    for name in names:
+        workflow.add_task(tasks[name])
+    workflow.mark_ready()
+    return workflow
+
+
+class TestTaskOrchestrator:
+    """Test layered workflow execution."""
+
+    @pytest.mark.asyncio
+    async def test_diamond_workflow(self):
+        """Test a diamond graph runs the join last and keeps workflow order."""
+        workflow = _build_workflow(
+            ("left", "root"), ("right", "root"), ("join", "left"), ("join", "right"),
+            names=["root", "left", "right", "join"]
+        )
+        # The left branch finishes after the right one
+        orchestrator = _TimedOrchestrator(_StubWorkflowRepository(), {"left": 0.02})
+
+        result = await orchestrator.execute_workflow(workflow, verbose=False)
+
+        assert result["success"] is True
+        assert orchestrator.started[0] == "root"
+        assert orchestrator.started[-1] == "join"
+        assert set(orchestrator.started[1:3]) == {"left", "right"}
+        assert all(task.status == TaskStatus.COMPLETED for task in workflow.tasks)
+        assert list(result["task_outputs"]) == [str(task.id) for task in workflow.tasks]
+        assert workflow.status == WorkflowStatus.COMPLETED
+        assert workflow.result.final_output == "output of join"
+        assert workflow.result.execution_time >= 0.02
+
+    @pytest.mark.asyncio
+    async def test_final_output_follows_workflow_order(self):
+        """Test the final output is the last listed task, not the last to finish."""
+        workflow = _build_workflow(
+            ("first_sink", "root"), ("second_sink", "root"),
+            names=["root", "first_sink", "second_sink"]
+        )
+        orchestrator = _TimedOrchestrator(_StubWorkflowRepository(), {"first_sink": 0.02})
+
+        await orchestrator.execute_workflow(workflow, verbose=False)
+
+        assert workflow.result.final_output == "output of second_sink"
@@ -0,0 +1,76 @@
+"""Unit tests for the background workflow persister."""
+
+import asyncio
+
+import pytest
+
+from core.domain.entities.workflow import Workflow, WorkflowType
+from core.infrastructure.orchestration.workflow_persister import BackgroundWorkflowPersister
+
+
+class _SlowWorkflowRepository:
+    """Workflow repository that records each write after a short delay."""
+
+    def __init__(self):
+        self.writes = []
+
+    async def update(self, workflow):
+        await asyncio.sleep(0.01)
+        self.writes.append((workflow.id, workflow.name))
+        return workflow
+
+
+class TestBackgroundWorkflowPersister:
+    """Test queueing, flushing and closing of the persister."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_enqueues_are_coalesced(self):
+        """Test a workflow queued several times is written once, in its latest state."""
+        repository = _SlowWorkflowRepository()
+        persister = BackgroundWorkflowPersister(repository)
+        workflow = Workflow(name="first", workflow_type=WorkflowType.BASIC)
+        other = Workflow(name="other", workflow_type=WorkflowType.BASIC)
+
+        await persister.enqueue(workflow)
+        await persister.enqueue(other)
+        workflow.name = "latest"
+        await persister.enqueue(workflow)
+        await persister.flush()
+
+        assert repository.writes == [(workflow.id, "latest"), (other.id, "other")]
+        await persister.close()
+
+    @pytest.mark.asyncio
+    async def test_close_writes_queued_updates_before_stopping(self):
+        """Test close flushes pending writes, then stops the worker."""
+        repository = _SlowWorkflowRepository()
+        persister = BackgroundWorkflowPersister(repository)
+        workflow = Workflow(name="queued", workflow_type=WorkflowType.BASIC)
+
+        await persister.enqueue(workflow)
+        worker = persister._worker
+        await persister.close()
+
+        assert repository.writes == [(workflow.id, "queued")]
+        assert worker.cancelled()
+        assert persister._worker is None
+
+        # A later enqueue starts a fresh worker
+        await persister.enqueue(workflow)
+        await persister.flush()
+        assert len(repository.writes) == 2
+        await persister.close()
+
+    def test_pending_updates_survive_a_new_event_loop(self):
+        """Test updates queued on a finished loop are written on the next one."""
+        repository = _SlowWorkflowRepository()
+        persister = BackgroundWorkflowPersister(repository)
+        workflow = Workflow(name="carried", workflow_type=WorkflowType.BASIC)
+
+        async def enqueue_only():
+            await persister.enqueue(workflow)
+
+        asyncio.run(enqueue_only())
+        asyncio.run(persister.close())
+
+        assert repository.writes == [(workflow.id, "carried")]